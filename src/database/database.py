@@ -2,27 +2,114 @@
 
 import sqlite3
 import json
-from typing import Optional, Dict, Any, List
+import threading
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Iterator, List, Sequence
 from datetime import datetime, date
 from pathlib import Path
 
 from ..utils.logger import setup_logger
-from ..utils.helpers import parse_meeting_json_fields, ensure_directory
+from ..utils.helpers import parse_meeting_json_fields, parse_meeting_json_fields_batch, ensure_directory
 
 logger = setup_logger(__name__)
 
+# Columns that may be requested through a `fields` projection
+MEETING_COLUMNS = frozenset({
+    'id', 'name', 'date', 'start_time', 'end_time', 'duration_minutes', 'duration_seconds',
+    'start_time_minutes', 'audio_file_path', 'transcript', 'summary', 'action_items',
+    'status', 'created_at', 'updated_at'
+})
+
+# Per-connection tuning: with WAL, NORMAL sync is still crash-safe; a 64 MB page cache and
+# memory-mapped reads keep repeated history queries off the pread path
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Full-text index over meeting names and transcripts, kept in sync with the meetings table by triggers
+FTS_SCHEMA = (
+    """
+    CREATE VIRTUAL TABLE meetings_fts USING fts5(
+        name, transcript, content='meetings', content_rowid='id'
+    )
+    """,
+    """
+    CREATE TRIGGER meetings_fts_insert AFTER INSERT ON meetings BEGIN
+        INSERT INTO meetings_fts(rowid, name, transcript) VALUES (new.id, new.name, new.transcript);
+    END
+    """,
+    """
+    CREATE TRIGGER meetings_fts_delete AFTER DELETE ON meetings BEGIN
+        INSERT INTO meetings_fts(meetings_fts, rowid, name, transcript)
+        VALUES ('delete', old.id, old.name, old.transcript);
+    END
+    """,
+    """
+    CREATE TRIGGER meetings_fts_update AFTER UPDATE OF name, transcript ON meetings BEGIN
+        INSERT INTO meetings_fts(meetings_fts, rowid, name, transcript)
+        VALUES ('delete', old.id, old.name, old.transcript);
+        INSERT INTO meetings_fts(rowid, name, transcript) VALUES (new.id, new.name, new.transcript);
+    END
+    """,
+)
+
+
+def _select_columns(fields: Optional[Sequence[str]], table: str = 'meetings') -> str:
+    """Build a SELECT column list from a whitelisted `fields` projection"""
+    if fields is None:
+        return f'{table}.*'
+    unknown = set(fields) - MEETING_COLUMNS
+    if unknown:
+        raise ValueError(f"Unknown meeting fields: {', '.join(sorted(unknown))}")
+    return ', '.join(f'{table}.{field}' for field in fields)
+
+
+def _fts_query(query: str) -> str:
+    """Turn free text into an FTS5 query: every word must match, as a prefix, with operators disabled"""
+    return ' '.join('"{}"*'.format(term.replace('"', '""')) for term in query.split())
+
+
+def _like_pattern(term: str) -> str:
+    """Wrap a search word in % wildcards, escaping LIKE's own wildcards (ESCAPE '\\')"""
+    return '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+
 class Database:
     """SQLite database manager for meeting data"""
     
     def __init__(self, db_path: str = "data/meetings.db"):
         self.db_path = Path(db_path)
+        # One tuned connection shared by every thread (the web server runs each
+        # request on a new one); _lock serializes its use
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
         
         ensure_directory(self.db_path.parent)
         self._init_database()
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Hold the shared connection for one operation, committing or rolling back on exit"""
+        with self._lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                for pragma in CONNECTION_PRAGMAS:
+                    self._conn.execute(pragma)
+            conn = self._conn
+            # Callers opt into sqlite3.Row per query
+            conn.row_factory = None
+            with conn:
+                yield conn
+    
     def _init_database(self):
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
+            # WAL is stored in the database file, so readers stop blocking on the writer from now on
+            cursor.execute("PRAGMA journal_mode=WAL")
+            
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS meetings (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -63,6 +150,28 @@ class Database:
             
             # Run migrations to add new columns to existing databases
             self._run_migrations(conn)
+            
+            self.fts_enabled = self._init_search(conn)
+    
+    def _init_search(self, conn) -> bool:
+        """Create the full-text search index if missing; returns False when SQLite lacks FTS5"""
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'meetings_fts'")
+        if cursor.fetchone():
+            return True
+        
+        try:
+            for statement in FTS_SCHEMA:
+                cursor.execute(statement)
+            # Index meetings recorded before the search index existed
+            cursor.execute("INSERT INTO meetings_fts(meetings_fts) VALUES ('rebuild')")
+            conn.commit()
+        except sqlite3.OperationalError as e:
+            conn.rollback()
+            logger.warning("Full-text search unavailable, falling back to LIKE: %s", e)
+            return False
+        
+        return True
     
     def _run_migrations(self, conn):
         """Run database migrations to add new columns"""
@@ -102,7 +211,7 @@ class Database:
             Meeting ID
         """
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             duration_minutes = None
@@ -141,7 +250,7 @@ class Database:
     
     def update_meeting_transcript(self, meeting_id: int, transcript: str) -> bool:
         """Update meeting transcript"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -156,7 +265,7 @@ class Database:
     
     def update_meeting_summary(self, meeting_id: int, summary: Dict[str, Any]) -> bool:
         """Update meeting summary"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Extract action items for separate storage
@@ -176,7 +285,7 @@ class Database:
     def update_meeting_duration(self, meeting_id: int, end_time: datetime, 
                                duration_minutes: int, duration_seconds: float) -> bool:
         """Update meeting with final end time and duration"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -192,7 +301,7 @@ class Database:
     
     def get_meeting(self, meeting_id: int) -> Optional[Dict[str, Any]]:
         """Get meeting by ID"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
@@ -209,7 +318,7 @@ class Database:
     
     def get_meetings_by_date(self, target_date: date) -> List[Dict[str, Any]]:
         """Get all meetings for a specific date"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
@@ -218,39 +327,87 @@ class Database:
                 (target_date,)
             )
             
-            meetings = []
-            for row in cursor.fetchall():
-                meeting = dict(row)
-                
-                # Parse JSON fields
-                meeting = parse_meeting_json_fields(meeting)
-                meetings.append(meeting)
-            
-            return meetings
+            # Parse JSON fields
+            return parse_meeting_json_fields_batch([dict(row) for row in cursor.fetchall()])
     
-    def get_meetings_by_date_range(self, days_back: int = 30) -> List[Dict[str, Any]]:
-        """Get meetings from the last N days"""
-        with sqlite3.connect(self.db_path) as conn:
+    def get_meetings_by_date_range(self, days_back: int = 30, limit: Optional[int] = None,
+                                   fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Get meetings from the last N days, newest first
+        
+        Args:
+            days_back: How many days of history to include
+            limit: Return at most this many meetings
+            fields: Only load these columns (see MEETING_COLUMNS), e.g. to skip transcripts
+        """
+        columns = _select_columns(fields)
+        
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
-            cursor.execute("""
-                SELECT * FROM meetings 
+            # SQLite treats a negative LIMIT as no limit
+            cursor.execute(f"""
+                SELECT {columns} FROM meetings 
                 WHERE date >= date('now', '-' || ? || ' days')
                 ORDER BY date DESC, start_time DESC
-            """, (days_back,))
+                LIMIT ?
+            """, (days_back, -1 if limit is None else limit))
             
-            meetings = []
-            for row in cursor.fetchall():
-                meeting = dict(row)
-                meeting = parse_meeting_json_fields(meeting)
-                meetings.append(meeting)
+            return parse_meeting_json_fields_batch([dict(row) for row in cursor.fetchall()])
+    
+    def search_meetings(self, query: str, limit: int = 20,
+                        fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Find meetings whose name or transcript contains every word of `query`
+        
+        With FTS5 each word matches the start of a token; the LIKE fallback
+        matches each word as a substring anywhere in the text.
+        
+        Args:
+            query: Free-text search words
+            limit: Return at most this many meetings
+            fields: Only load these columns (see MEETING_COLUMNS)
+            
+        Returns:
+            Matching meetings, best match first (newest first without FTS5)
+        """
+        if not query.split():
+            return []
+        
+        columns = _select_columns(fields)
+        
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
             
-            return meetings
+            if self.fts_enabled:
+                cursor.execute(f"""
+                    SELECT {columns} FROM meetings_fts
+                    JOIN meetings ON meetings.id = meetings_fts.rowid
+                    WHERE meetings_fts MATCH ?
+                    ORDER BY bm25(meetings_fts)
+                    LIMIT ?
+                """, (_fts_query(query), limit))
+            else:
+                terms = query.split()
+                conditions = " AND ".join(["(name LIKE ? ESCAPE '\\' OR transcript LIKE ? ESCAPE '\\')"] * len(terms))
+                params = []
+                for term in terms:
+                    pattern = _like_pattern(term)
+                    params += [pattern, pattern]
+                cursor.execute(f"""
+                    SELECT {columns} FROM meetings
+                    WHERE {conditions}
+                    ORDER BY date DESC, start_time DESC
+                    LIMIT ?
+                """, (*params, limit))
+            
+            return parse_meeting_json_fields_batch([dict(row) for row in cursor.fetchall()])
     
     def save_daily_summary(self, target_date: date, total_meetings: int, summary: str, key_themes: List[str]) -> bool:
         """Save or update daily summary"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Create summary data structure
@@ -278,7 +435,7 @@ class Database:
     
     def get_daily_summary(self, target_date: date) -> Optional[Dict[str, Any]]:
         """Get daily summary for date"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
@@ -301,5 +458,8 @@ class Database:
     
     
     def close(self):
-        """Close database connection (SQLite auto-closes, but for interface compatibility)"""
-        pass
\ No newline at end of file
+        """Close the shared database connection; it is reopened if the database is used again"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
\ No newline at end of file
@@ -1,7 +1,7 @@
 """Meeting Agent Main Application - Orchestrates all components"""
 
 from datetime import datetime, date
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence
 from pathlib import Path
 
 from .utils.logger import setup_logger
@@ -10,6 +10,7 @@ from .utils.helpers import ensure_directory
 from .database.database import Database
 from .audio.recorder import AudioRecorder
 from .transcription.simple_transcriber import SimpleTranscriber
+from .transcription.local_transcriber import LocalWhisperTranscriber
 from .ai.summarizer import Summarizer
 from .notifications.sender import EmailSender
 
@@ -29,10 +30,22 @@ class MeetingAgent:
             channels=get_config_value(self.config, 'audio.channels', 1),
             chunk_size=get_config_value(self.config, 'audio.chunk_size', 1024)
         )
-        self.transcriber = SimpleTranscriber(
-            api_key=get_config_value(self.config, 'openai.api_key'),
-            model=get_config_value(self.config, 'openai.transcription_model', 'whisper-1')
-        )
+        if get_config_value(self.config, 'transcription.backend', 'openai') == 'local':
+            self.transcriber = LocalWhisperTranscriber(
+                model_size=get_config_value(self.config, 'transcription.local_model', 'small'),
+                device=get_config_value(self.config, 'transcription.device', 'auto'),
+                sample_rate=self.audio_recorder.sample_rate,
+                channels=self.audio_recorder.channels
+            )
+        else:
+            self.transcriber = SimpleTranscriber(
+                api_key=get_config_value(self.config, 'openai.api_key'),
+                model=get_config_value(self.config, 'openai.transcription_model', 'whisper-1'),
+                sample_rate=self.audio_recorder.sample_rate,
+                channels=self.audio_recorder.channels,
+                cost_per_minute=get_config_value(self.config, 'cost.whisper_per_minute', 0.006),
+                silence_threshold=get_config_value(self.config, 'transcription.silence_threshold', 0)
+            )
         self.summarizer = Summarizer(
             api_key=get_config_value(self.config, 'openai.api_key'),
             model=get_config_value(self.config, 'openai.summarization_model', 'gpt-4')
@@ -45,7 +58,8 @@ class MeetingAgent:
                 email_address=email_address,
                 email_password=email_password,
                 smtp_server=get_config_value(self.config, 'email.smtp_server', 'smtp.gmail.com'),
-                smtp_port=get_config_value(self.config, 'email.smtp_port', 587)
+                smtp_port=get_config_value(self.config, 'email.smtp_port', 587),
+                require_tls=get_config_value(self.config, 'email.require_tls', True)
             )
         else:
             self.email_sender = None
@@ -133,11 +147,17 @@ class MeetingAgent:
             'status': 'recording',
             'meeting': self.current_meeting,
             'duration_seconds': duration,
-            'duration_minutes': int(duration / 60)
+            'duration_minutes': int(duration / 60),
+            'cost_info': self.transcriber.get_cost_info()
         }
     
-    def get_meeting_history(self, days_back: int = 30) -> List[Dict[str, Any]]:
-        return self.db.get_meetings_by_date_range(days_back)
+    def get_meeting_history(self, days_back: int = 30, limit: Optional[int] = None,
+                            fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        return self.db.get_meetings_by_date_range(days_back, limit, fields)
+    
+    def search_meetings(self, query: str, limit: int = 20,
+                        fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        return self.db.search_meetings(query, limit, fields)
     
     def get_meeting_details(self, meeting_id: int) -> Optional[Dict[str, Any]]:
         return self.db.get_meeting(meeting_id)
@@ -176,4 +196,6 @@ class MeetingAgent:
     def cleanup(self):
         self.audio_recorder.cleanup()
         self.transcriber.cleanup()
+        if self.email_sender:
+            self.email_sender.close()
         self.db.close()
@@ -3,11 +3,14 @@ Simple email sender for Meeting Agent
 Sends plain text email notifications for meetings
 """
 
+import ipaddress
 import os
+import queue
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Optional, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
 from ..utils.logger import setup_logger
@@ -18,30 +21,59 @@ logger = setup_logger(__name__)
 class EmailSender:
     """Simple email sender for meeting notifications"""
     
+    MEETING_SUBJECT_PREFIX = "Meeting Summary: "
+    DAILY_SUBJECT_PREFIX = "Daily Summary - "
+    
     def __init__(
         self,
         email_address: Optional[str] = None,
         email_password: Optional[str] = None,
         smtp_server: str = "smtp.gmail.com",
-        smtp_port: int = 587
+        smtp_port: int = 587,
+        max_messages_per_connection: int = 100,
+        concurrency: int = 1,
+        require_tls: bool = True
     ):
         """Initialize email sender with credentials"""
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
+        # Plain text is only allowed to a relay on this machine or when explicitly opted into
+        self.require_tls = require_tls and not _is_loopback(smtp_server)
         self.email_address = email_address or os.getenv('EMAIL_ADDRESS')
         self.email_password = email_password or os.getenv('EMAIL_PASSWORD')
+        self.max_messages_per_connection = max_messages_per_connection
+        self.concurrency = max(1, concurrency)
+        
+        self._enabled = bool(self.email_address and self.email_password)
+        self._default_recipient = self.email_address
+        
+        # Authenticated SMTP session, opened lazily and reused across sends.
+        # Web request threads share it, so it is only touched under _lock
+        # (reentrant so send_batch can hold it across a whole batch)
+        self._lock = threading.RLock()
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._msgs_on_conn = 0
+        
+        # Session pool for concurrent batches; slots hold (connection, sent count)
+        # and start empty so connections are only opened when first needed
+        self._pool: Optional[queue.Queue] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
         
-        if not self.email_address or not self.email_password:
+        if not self._enabled:
             logger.warning("Email credentials not configured - email features disabled")
     
+    def __del__(self):
+        """Close the SMTP session on destruction"""
+        self.close()
+    
     def send_meeting_summary(self, summary: Dict[str, Any], recipient: Optional[str] = None) -> bool:
         """Send meeting summary email"""
-        if not self.email_address or not self.email_password:
+        if not self._enabled:
             return False
             
         try:
-            recipient = recipient or self.email_address
-            subject = f"Meeting Summary: {summary.get('meeting_name', 'Unknown')}"
+            recipient = recipient or self._default_recipient
+            subject = f"{self.MEETING_SUBJECT_PREFIX}{summary.get('meeting_name', 'Unknown')}"
             
             # Create simple text content
             content = self._format_meeting_summary(summary)
@@ -54,13 +86,13 @@ class EmailSender:
     
     def send_daily_summary(self, daily_summary: Dict[str, Any], recipient: Optional[str] = None) -> bool:
         """Send daily summary email"""
-        if not self.email_address or not self.email_password:
+        if not self._enabled:
             return False
             
         try:
-            recipient = recipient or self.email_address
+            recipient = recipient or self._default_recipient
             total_meetings = daily_summary.get('total_meetings', 0)
-            subject = f"Daily Summary - {total_meetings} meetings"
+            subject = f"{self.DAILY_SUBJECT_PREFIX}{total_meetings} meetings"
             
             # Create simple text content
             content = self._format_daily_summary(daily_summary)
@@ -71,84 +103,344 @@ class EmailSender:
             logger.error(f"Failed to send daily summary: {e}")
             return False
     
-    def _send_email(self, recipient: str, subject: str, content: str) -> bool:
-        """Send email via SMTP"""
+    def send_meeting_summaries(self, summaries: List[Dict[str, Any]], recipient: Optional[str] = None) -> List[bool]:
+        """Send several meeting summary emails over one SMTP session"""
+        today_str = datetime.now().strftime('%B %d, %Y')
+        messages = []
+        for summary in summaries:
+            subject = f"{self.MEETING_SUBJECT_PREFIX}{summary.get('meeting_name', 'Unknown')}"
+            messages.append((recipient, subject, self._format_meeting_summary(summary, today_str)))
+        return self.send_batch(messages)
+    
+    def send_batch(self, messages: List[Tuple[Optional[str], str, str]]) -> List[bool]:
+        """
+        Send (recipient, subject, content) messages over a shared SMTP session
+        
+        The session is reset with RSET between messages and reopened every
+        max_messages_per_connection messages. The batch is abandoned once a
+        third of it has failed; unsent messages are reported as False.
+        """
+        if not self._enabled:
+            return [False] * len(messages)
+        
+        if self.concurrency > 1 and len(messages) > 1:
+            return self._send_batch_concurrent(messages)
+        
+        results: List[bool] = []
+        failures = 0
+        
+        with self._lock:
+            for recipient, subject, content in messages:
+                # RSET doubles as the liveness probe for the shared session
+                verify = not self._reset_session()
+                success = self._send_email(recipient or self._default_recipient, subject, content, verify=verify)
+                results.append(success)
+                
+                if not success:
+                    failures += 1
+                    if failures * 3 >= len(messages):
+                        logger.error(f"Aborting email batch after {failures} failures")
+                        break
+        
+        results.extend([False] * (len(messages) - len(results)))
+        return results
+    
+    def _send_batch_concurrent(self, messages: List[Tuple[Optional[str], str, str]]) -> List[bool]:
+        """Send a batch across up to `concurrency` SMTP sessions in parallel"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="smtp")
+                self._pool = queue.Queue(maxsize=self.concurrency)
+                for _ in range(self.concurrency):
+                    self._pool.put((None, 0))
+        
+        # Workers count failures as they finish; once a third of the batch has
+        # failed, messages that have not started yet are skipped
+        abort = threading.Event()
+        failures_lock = threading.Lock()
+        failures = 0
+        
+        def send(recipient: str, subject: str, content: str) -> bool:
+            nonlocal failures
+            if abort.is_set():
+                return False
+            success = self._send_pooled(recipient, subject, content)
+            if not success:
+                with failures_lock:
+                    failures += 1
+                    if failures * 3 >= len(messages) and not abort.is_set():
+                        logger.error(f"Aborting email batch after {failures} failures")
+                        abort.set()
+            return success
+        
+        futures = [
+            self._executor.submit(send, recipient or self._default_recipient, subject, content)
+            for recipient, subject, content in messages
+        ]
+        
+        results: List[bool] = []
+        for future in futures:
+            if abort.is_set():
+                for pending in futures:
+                    pending.cancel()
+            results.append(False if future.cancelled() else future.result())
+        
+        return results
+    
+    def _send_pooled(self, recipient: str, subject: str, content: str) -> bool:
+        """Send one email using a session borrowed from the pool"""
+        server, sent = self._pool.get()
         try:
-            msg = MIMEText(content)
-            msg['Subject'] = subject
-            msg['From'] = self.email_address
-            msg['To'] = recipient
+            msg = self._build_message(recipient, subject, content)
             
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.email_address, self.email_password)
+            try:
+                if server is None:
+                    server, sent = self._open_connection(), 0
                 server.send_message(msg)
+            except OSError as e:
+                if not _connection_lost(e):
+                    raise
+                logger.warning(f"Pooled SMTP session lost ({e}), reconnecting")
+                self._close_quietly(server)
+                server, sent = None, 0
+                server = self._open_connection()
+                server.send_message(msg)
+            
+            sent += 1
+            if sent >= self.max_messages_per_connection:
+                self._close_quietly(server, quit=True)
+                server, sent = None, 0
             
             logger.info(f"Email sent to {recipient}")
             return True
             
         except Exception as e:
-            logger.error(f"SMTP error: {e}")
+            if isinstance(e, smtplib.SMTPException) and not _connection_lost(e):
+                # The server refused this message; keep the session if it still answers RSET
+                logger.error(f"Email to {recipient} rejected: {e}")
+                if server is not None and not self._rset(server):
+                    self._close_quietly(server)
+                    server, sent = None, 0
+            else:
+                logger.error(f"SMTP error: {e}")
+                self._close_quietly(server)
+                server, sent = None, 0
             return False
+        finally:
+            self._pool.put((server, sent))
     
-    def _format_meeting_summary(self, summary: Dict[str, Any]) -> str:
-        """Format meeting summary as plain text"""
-        lines = [
-            f"MEETING SUMMARY: {summary.get('meeting_name', 'Unknown')}",
-            f"Date: {datetime.now().strftime('%B %d, %Y')}",
-            f"Duration: {summary.get('duration_minutes', 0)} minutes",
-            "",
-            "EXECUTIVE SUMMARY:",
-            summary.get('executive_summary', 'No summary available'),
-            "",
-            "KEY POINTS:",
-        ]
-        
-        for point in summary.get('key_points', []):
-            lines.append(f"• {point}")
-        
-        lines.extend(["", "DECISIONS:"])
-        for decision in summary.get('decisions_made', []):
-            lines.append(f"• {decision}")
+    def _build_message(self, recipient: str, subject: str, content: str) -> Message:
+        """Build a plain text email message"""
+        # Built fresh each time: cloning a cached header template measured slower
+        # (copy.deepcopy) or relied on Message internals (copy.copy)
+        msg = Message()
+        msg['MIME-Version'] = '1.0'
+        msg['From'] = self.email_address
+        msg['To'] = recipient
+        msg['Subject'] = subject
+        # Adds Content-Type and Content-Transfer-Encoding for UTF-8 text
+        msg.set_payload(content, charset='utf-8')
+        return msg
+    
+    def _send_email(self, recipient: str, subject: str, content: str, verify: bool = True) -> bool:
+        """Send email via SMTP"""
+        with self._lock:
+            try:
+                msg = self._build_message(recipient, subject, content)
+                
+                try:
+                    self._get_connection(verify).send_message(msg)
+                except OSError as e:
+                    if not _connection_lost(e):
+                        raise
+                    # Cached session went stale - reconnect and retry once
+                    logger.warning(f"SMTP session lost ({e}), reconnecting")
+                    self._drop_connection()
+                    self._get_connection().send_message(msg)
+                
+                self._msgs_on_conn += 1
+                if self._msgs_on_conn >= self.max_messages_per_connection:
+                    # Recycle only this session; pooled sessions have their own counters
+                    self._close_quietly(self._smtp, quit=True)
+                    self._smtp = None
+                
+                logger.info(f"Email sent to {recipient}")
+                return True
+                
+            except Exception as e:
+                if isinstance(e, smtplib.SMTPException) and not _connection_lost(e):
+                    # The server refused this message; the session itself is still good
+                    logger.error(f"Email to {recipient} rejected: {e}")
+                    self._reset_session()
+                else:
+                    logger.error(f"SMTP error: {e}")
+                    self._drop_connection()
+                return False
+    
+    def _reset_session(self) -> bool:
+        """Reset the cached SMTP session between messages, True if it is still usable"""
+        if self._smtp is None:
+            return False
+        if self._rset(self._smtp):
+            return True
+        self._drop_connection()
+        return False
+    
+    @staticmethod
+    def _rset(server: smtplib.SMTP) -> bool:
+        """Send RSET on a session, True if the server accepted it"""
+        try:
+            return server.rset()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+    
+    def _get_connection(self, verify: bool = True) -> smtplib.SMTP:
+        """Return the cached SMTP session, reconnecting if it is no longer healthy"""
+        if self._smtp is not None:
+            if not verify:
+                return self._smtp
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._drop_connection()
         
-        lines.extend(["", "ACTION ITEMS:"])
-        for item in summary.get('action_items', []):
-            if isinstance(item, dict):
-                lines.append(f"• {item.get('task', item)}")
+        self._smtp = self._open_connection()
+        self._msgs_on_conn = 0
+        return self._smtp
+    
+    def _open_connection(self) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP session"""
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            # Only negotiate what the server advertises, so a local relay
+            # without TLS or AUTH skips those round trips. A remote server
+            # missing STARTTLS may have had it stripped from the EHLO reply
+            # on the way, so that is an error unless TLS is not required
+            server.ehlo()
+            encrypted = server.has_extn('starttls')
+            if encrypted:
+                server.starttls()
+                server.ehlo()
+            elif self.require_tls:
+                raise smtplib.SMTPNotSupportedError(
+                    f"{self.smtp_server} does not offer STARTTLS - refusing to send email in plain text"
+                )
+            if server.has_extn('auth'):
+                if not encrypted:
+                    raise smtplib.SMTPNotSupportedError(
+                        "Server requires AUTH without STARTTLS - refusing to send credentials in plain text"
+                    )
+                server.login(self.email_address, self.email_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    @staticmethod
+    def _close_quietly(server: Optional[smtplib.SMTP], quit: bool = False):
+        """Close an SMTP session, ignoring errors from an already broken connection"""
+        if server is None:
+            return
+        try:
+            if quit:
+                server.quit()
             else:
-                lines.append(f"• {item}")
-        
-        lines.extend(["", "NEXT STEPS:"])
-        for step in summary.get('next_steps', []):
-            lines.append(f"• {step}")
-        
-        return "\n".join(lines)
+                server.close()
+        except Exception:
+            pass
     
-    def _format_daily_summary(self, summary: Dict[str, Any]) -> str:
-        """Format daily summary as plain text"""
-        lines = [
-            f"DAILY MEETING SUMMARY - {datetime.now().strftime('%B %d, %Y')}",
-            f"Total Meetings: {summary.get('total_meetings', 0)}",
-            f"Total Duration: {summary.get('total_duration', 0)} minutes",
-            "",
-            "OVERVIEW:",
-            summary.get('daily_summary', 'No meetings today'),
-            "",
-            "KEY THEMES:",
-        ]
+    def _drop_connection(self):
+        """Forget the cached SMTP session without talking to the server"""
+        self._close_quietly(self._smtp)
+        self._smtp = None
+    
+    def close(self):
+        """Close the cached SMTP session and any pooled sessions"""
+        lock = getattr(self, '_lock', None)
+        if lock is None:  # __init__ did not finish, nothing was opened
+            return
         
-        for theme in summary.get('key_themes', []):
-            lines.append(f"• {theme}")
+        with lock:
+            self._close_quietly(self._smtp, quit=True)
+            self._smtp = None
         
-        lines.extend(["", "TODAY'S MEETINGS:"])
-        for meeting in summary.get('meeting_titles', []):
-            lines.append(f"• {meeting}")
+        if getattr(self, '_executor', None) is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            while not self._pool.empty():
+                server, _ = self._pool.get_nowait()
+                self._close_quietly(server, quit=True)
+            self._pool = None
+    
+    def _format_meeting_summary(self, summary: Dict[str, Any], today_str: Optional[str] = None) -> str:
+        """Format meeting summary as plain text"""
+        if today_str is None:
+            today_str = datetime.now().strftime('%B %d, %Y')
         
-        lines.extend(["", "ALL ACTION ITEMS:"])
-        for item in summary.get('all_action_items', []):
-            if isinstance(item, dict):
-                lines.append(f"• {item.get('task', item)}")
-            else:
-                lines.append(f"• {item}")
+        return (
+            f"MEETING SUMMARY: {summary.get('meeting_name', 'Unknown')}\n"
+            f"Date: {today_str}\n"
+            f"Duration: {summary.get('duration_minutes', 0)} minutes\n"
+            f"\n"
+            f"EXECUTIVE SUMMARY:\n"
+            f"{summary.get('executive_summary', 'No summary available')}\n"
+            f"\n"
+            f"KEY POINTS:{_bullets(summary.get('key_points', []))}\n"
+            f"\n"
+            f"DECISIONS:{_bullets(summary.get('decisions_made', []))}\n"
+            f"\n"
+            f"ACTION ITEMS:{_task_bullets(summary.get('action_items', []))}\n"
+            f"\n"
+            f"NEXT STEPS:{_bullets(summary.get('next_steps', []))}"
+        )
+    
+    def _format_daily_summary(self, summary: Dict[str, Any], today_str: Optional[str] = None) -> str:
+        """Format daily summary as plain text"""
+        if today_str is None:
+            today_str = datetime.now().strftime('%B %d, %Y')
         
-        return "\n".join(lines)
\ No newline at end of file
+        return (
+            f"DAILY MEETING SUMMARY - {today_str}\n"
+            f"Total Meetings: {summary.get('total_meetings', 0)}\n"
+            f"Total Duration: {summary.get('total_duration', 0)} minutes\n"
+            f"\n"
+            f"OVERVIEW:\n"
+            f"{summary.get('daily_summary', 'No meetings today')}\n"
+            f"\n"
+            f"KEY THEMES:{_bullets(summary.get('key_themes', []))}\n"
+            f"\n"
+            f"TODAY'S MEETINGS:{_bullets(summary.get('meeting_titles', []))}\n"
+            f"\n"
+            f"ALL ACTION ITEMS:{_task_bullets(summary.get('all_action_items', []))}"
+        )
+
+
+def _is_loopback(host: str) -> bool:
+    """True if an SMTP host name refers to this machine"""
+    if host.lower() == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _connection_lost(error: Exception) -> bool:
+    """True if an SMTP error means the session is gone rather than that one message was refused"""
+    # SMTPException subclasses OSError, so socket errors are the OSErrors that are not SMTPExceptions
+    return isinstance(error, smtplib.SMTPServerDisconnected) or not isinstance(error, smtplib.SMTPException)
+
+
+def _bullets(items) -> str:
+    """Render items as bullet lines, each prefixed with a newline"""
+    return "".join(f"\n• {item}" for item in items)
+
+
+def _task_bullets(items) -> str:
+    """Render action items (task dicts or plain strings) as bullet lines"""
+    return "".join(
+        f"\n• {item.get('task', item)}" if isinstance(item, dict) else f"\n• {item}"
+        for item in items
+    )
@@ -3,5 +3,6 @@ Transcription package for Meeting Agent
 """
 
 from .simple_transcriber import SimpleTranscriber
+from .local_transcriber import LocalWhisperTranscriber
 
-__all__ = ["SimpleTranscriber"]
\ No newline at end of file
+__all__ = ["SimpleTranscriber", "LocalWhisperTranscriber"]
\ No newline at end of file
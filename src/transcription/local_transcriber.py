@@ -0,0 +1,80 @@
+"""Local Whisper transcriber - runs faster-whisper (CTranslate2) instead of calling the OpenAI API"""
+
+import io
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import ctranslate2
+    from faster_whisper import WhisperModel, BatchedInferencePipeline
+except ImportError:
+    ctranslate2 = None
+    WhisperModel = None
+    BatchedInferencePipeline = None
+
+from .simple_transcriber import SimpleTranscriber, WHISPER_SAMPLE_RATE
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+LOCAL_BATCH_SIZE = 8
+
+
+class LocalWhisperTranscriber(SimpleTranscriber):
+    """Same batch-at-stop flow as SimpleTranscriber, with INT8 inference on this machine and no per-minute cost"""
+    
+    # One model instance; batching happens inside the inference pipeline
+    _max_parallel_segments = 1
+    
+    def __init__(self, model_size: str = "small", device: str = "auto", compute_type: Optional[str] = None,
+                 sample_rate: int = 44100, channels: int = 2):
+        super().__init__(api_key=None, model=model_size, sample_rate=sample_rate, channels=channels, cost_per_minute=0.0)
+        self._device = device
+        self._compute_type = compute_type
+        self._pipeline = None
+        # Segments run one at a time, so a single float32 buffer can be reused for each
+        self._f32_scratch = None
+    
+    def _transcribe_segment(self, audio_data: memoryview, sample_rate: int, channels: int) -> str:
+        """Transcribe one PCM segment with the local model"""
+        try:
+            if np is not None and sample_rate == WHISPER_SAMPLE_RATE and channels == 1:
+                audio = self._to_float32(audio_data)
+            else:
+                # faster-whisper decodes and resamples file input itself
+                audio = io.BytesIO(self._create_wav(audio_data, sample_rate, channels))
+            
+            segments, _ = self._get_pipeline().transcribe(audio, batch_size=LOCAL_BATCH_SIZE, vad_filter=True)
+            return " ".join(segment.text.strip() for segment in segments).strip()
+            
+        except Exception as e:
+            logger.error("Local transcription error: %s", e)
+            return ""
+    
+    def _to_float32(self, audio_data: memoryview):
+        """Scale 16-bit PCM to float32 in [-1, 1) in one pass, into the reused scratch buffer"""
+        pcm = np.frombuffer(audio_data, dtype='<i2')
+        if self._f32_scratch is None or self._f32_scratch.size < pcm.size:
+            self._f32_scratch = np.empty(pcm.size, dtype=np.float32)
+        
+        return np.multiply(pcm, np.float32(1.0 / 32768.0), out=self._f32_scratch[:pcm.size], casting='unsafe')
+    
+    def _get_pipeline(self):
+        """Return the batched inference pipeline, loading the model on first use"""
+        if self._pipeline is None:
+            if WhisperModel is None:
+                raise ImportError("faster-whisper package is not installed. Please install with: pip install faster-whisper")
+            
+            device = self._device
+            if device == "auto":
+                device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+            compute_type = self._compute_type or ("int8_float16" if device == "cuda" else "int8")
+            
+            logger.info("Loading local Whisper model %s on %s (%s)", self.model, device, compute_type)
+            model = WhisperModel(self.model, device=device, compute_type=compute_type)
+            self._pipeline = BatchedInferencePipeline(model=model)
+        return self._pipeline
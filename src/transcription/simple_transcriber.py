@@ -1,45 +1,120 @@
 """Simplified synchronous transcriber - no threading, no hanging"""
 
-import os
-import time
-import tempfile
-import wave
-from typing import List, Dict, Any, Optional, Callable
+import io
+import math
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Callable, Tuple, List
+
+try:
+    import openai
+except ImportError:
+    openai = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401 - lets httpx negotiate HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from scipy.signal import resample_poly
+except ImportError:
+    resample_poly = None
+
+try:
+    import soundfile as sf
+except ImportError:
+    sf = None
+
 from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Whisper resamples everything to 16 kHz mono, so anything more is wasted upload
+WHISPER_SAMPLE_RATE = 16000
+
+AUDIO_MIME_TYPES = {'.flac': 'audio/flac', '.wav': 'audio/wav'}
+
+# Long recordings are split into segments that are uploaded in parallel
+SEGMENT_SECONDS = 300
+SPLIT_SEARCH_SECONDS = 10
+MAX_PARALLEL_UPLOADS = 8
+
+# Downmixing and resampling work through the recording this many seconds at a time
+RESAMPLE_BLOCK_SECONDS = 30
+
+# One HTTP connection pool is shared by every transcriber in the process
+_shared_http_client = None
+_client_lock = threading.Lock()
+
+# Canonical 44-byte PCM WAV header; the format is fixed so the wave module is not needed
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+# Energy gate: with a silence threshold set, a segment is sent only if enough
+# 30 ms frames rise above it
+VAD_FRAME_MS = 30
+MIN_SPEECH_FRAMES = 10
+
+
 class SimpleTranscriber:
     
-    def __init__(self, api_key: str, model: str = "whisper-1"):
+    _max_parallel_segments = MAX_PARALLEL_UPLOADS
+    
+    def __init__(self, api_key: str, model: str = "whisper-1", sample_rate: int = 44100, channels: int = 2,
+                 cost_per_minute: float = 0.006, silence_threshold: float = 0.0):
         self.api_key = api_key
         self.model = model
+        self.cost_per_minute = cost_per_minute
+        # 16-bit RMS level below which a segment is treated as silence and not uploaded; 0 disables the gate
+        self.silence_threshold = silence_threshold
+        
+        # OpenAI client is created on first use and kept, so its HTTP
+        # connection pool stays warm across transcriptions
+        self._client = None
         
         self.is_transcribing = False
-        self.audio_chunks: List[bytes] = []
+        # Raw PCM grows in place as chunks arrive, so no join is needed at stop
+        self._audio_buffer = bytearray()
+        self._chunk_count = 0
         self.current_transcript = ""  # For web debugging compatibility
+        self.skipped_silence_seconds = 0.0
         
-        self._sample_rate = 44100
-        self._channels = 2
+        self._sample_rate = sample_rate
+        self._channels = channels
         self._sample_width = 2
     
     def start_transcription(self, on_transcript_callback: Optional[Callable] = None) -> bool:
         self.is_transcribing = True
-        self.audio_chunks.clear()
+        self._audio_buffer.clear()
+        self._chunk_count = 0
         self.current_transcript = ""
+        self.skipped_silence_seconds = 0.0
         return True
     
     def add_audio_chunk(self, audio_data: bytes) -> bool:
         if not self.is_transcribing:
             return False
         
-        self.audio_chunks.append(audio_data)
+        self._audio_buffer += audio_data
+        self._chunk_count += 1
         return True
     
     def stop_transcription(self) -> str:
         """Process all audio chunks and return transcript"""
         
-        if not self.audio_chunks:
+        if not self._audio_buffer:
             logger.warning("No audio chunks collected - returning empty transcript")
             self.is_transcribing = False
             return ""
@@ -56,94 +131,202 @@ class SimpleTranscriber:
             return full_transcript
             
         except Exception as e:
-            logger.error(f"Simple transcription failed: {e}")
+            logger.error("Simple transcription failed: %s", e)
             self.is_transcribing = False
             return ""
     
     def _process_all_chunks_sync(self) -> str:
-        """Process all audio chunks synchronously in batches"""
+        """Process all audio chunks synchronously, uploading long recordings in parallel segments"""
         
-        if len(self.audio_chunks) < 10:  # Need minimum chunks
-            logger.warning(f"Too few chunks ({len(self.audio_chunks)}) for transcription")
+        if self._chunk_count < 10:  # Need minimum chunks
+            logger.warning("Too few chunks (%d) for transcription", self._chunk_count)
             return ""
         
-        # Create one large WAV file from all chunks
-        wav_data = self._create_wav_from_chunks(self.audio_chunks)
+        # Create one large audio file from all audio
+        pcm_data, sample_rate, channels = self._downsample_for_whisper(self._audio_buffer)
         
-        if len(wav_data) < 5000:  # Skip very small files
-            logger.warning(f"Audio file too small ({len(wav_data)} bytes)")
+        if len(pcm_data) < 5000:  # Skip very small files
+            logger.warning("Audio file too small (%d bytes)", len(pcm_data))
             return ""
         
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-            temp_file.write(wav_data)
-            temp_path = temp_file.name
+        # Calculate total audio duration
+        audio_duration = len(self._audio_buffer) / (self._sample_rate * self._channels * self._sample_width)
+        self.total_audio_duration = audio_duration
         
-        try:
-            # Calculate total audio duration
-            audio_duration = len(self.audio_chunks) * 1024 / (self._sample_rate * self._channels * self._sample_width)
-            self.total_audio_duration = audio_duration
-            
-            logger.info(f"Transcribing {audio_duration:.1f}s of audio in one batch...")
-            
-            # Single OpenAI API call for entire meeting
-            start_time = time.time()
-            transcript = self._transcribe_audio_file(temp_path)
-            api_time = time.time() - start_time
-            
-            
-            return transcript
+        segments = self._split_segments(pcm_data, sample_rate, channels)
+        
+        # Silent segments would be billed without producing any text
+        speech_segments = [segment for segment in segments if self._has_speech(segment, sample_rate, channels)]
+        silent_bytes = sum(len(segment) for segment in segments) - sum(len(segment) for segment in speech_segments)
+        self.skipped_silence_seconds = silent_bytes / (sample_rate * channels * self._sample_width)
+        
+        if not speech_segments:
+            logger.warning("No audio above silence threshold %s in %.1fs of recording - skipping transcription",
+                           self.silence_threshold, audio_duration)
+            return ""
+        
+        segments = speech_segments
+        logger.info("Transcribing %.1fs of audio in %d segment(s)...", audio_duration, len(segments))
+        
+        def transcribe_segment(segment: memoryview) -> str:
+            return self._transcribe_segment(segment, sample_rate, channels)
+        
+        if len(segments) == 1:
+            return transcribe_segment(segments[0])
+        
+        # Upload segments concurrently; map() keeps results in recording order
+        with ThreadPoolExecutor(max_workers=min(self._max_parallel_segments, len(segments))) as executor:
+            transcripts = list(executor.map(transcribe_segment, segments))
+        
+        return " ".join(transcript for transcript in transcripts if transcript)
+    
+    def _transcribe_segment(self, audio_data: memoryview, sample_rate: int, channels: int) -> str:
+        """Encode one PCM segment and transcribe it"""
+        return self._transcribe_audio(*self._encode_audio(audio_data, sample_rate, channels))
+    
+    def _split_segments(self, audio_data: bytes, sample_rate: int, channels: int) -> List[memoryview]:
+        """Split PCM into roughly SEGMENT_SECONDS pieces, cutting at quiet points"""
+        frame_bytes = channels * self._sample_width
+        segment_bytes = SEGMENT_SECONDS * sample_rate * frame_bytes
+        
+        # Segments are views into the PCM, so splitting does not copy the recording
+        audio_data = memoryview(audio_data)
+        segments = []
+        start = 0
+        while len(audio_data) - start > segment_bytes:
+            end = self._find_quiet_split(audio_data, start + segment_bytes, sample_rate, channels)
+            segments.append(audio_data[start:end])
+            start = end
+        segments.append(audio_data[start:])
+        
+        return segments
+    
+    def _find_quiet_split(self, audio_data: bytes, target: int, sample_rate: int, channels: int) -> int:
+        """Move a split point back to the quietest 100 ms window before it, so words are not cut"""
+        if np is None:
+            return target
+        
+        frame_bytes = channels * self._sample_width
+        window_bytes = sample_rate // 10 * frame_bytes
+        search_start = target - SPLIT_SEARCH_SECONDS * 10 * window_bytes
+        
+        samples = np.frombuffer(audio_data[search_start:target], dtype='<i2')
+        windows = samples.reshape(-1, window_bytes // self._sample_width)
+        quietest = int(np.abs(windows.astype(np.int32)).sum(axis=1).argmin())
+        
+        return search_start + quietest * window_bytes + window_bytes // 2 // frame_bytes * frame_bytes
+    
+    def _has_speech(self, audio_data: bytes, sample_rate: int, channels: int) -> bool:
+        """Return True if enough 30 ms frames are louder than the silence threshold"""
+        if np is None or self.silence_threshold <= 0:
+            return True
+        
+        frame_samples = sample_rate * VAD_FRAME_MS // 1000 * channels
+        samples = np.frombuffer(audio_data, dtype='<i2')
+        frame_count = len(samples) // frame_samples
+        if frame_count == 0:
+            return True
+        
+        frames = samples[:frame_count * frame_samples].reshape(frame_count, frame_samples).astype(np.float32)
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        return int(np.count_nonzero(rms > self.silence_threshold)) >= MIN_SPEECH_FRAMES
+    
+    def _downsample_for_whisper(self, audio_data: bytes) -> Tuple[bytearray, int, int]:
+        """Downmix 16-bit PCM to mono and resample to 16 kHz when numpy/scipy are available
+        
+        Works through the recording in RESAMPLE_BLOCK_SECONDS blocks of float32, so the extra
+        memory is one block rather than several copies of the whole recording.
+        """
+        if np is None:
+            return bytes(audio_data), self._sample_rate, self._channels
+        
+        channels = self._channels
+        samples = np.frombuffer(audio_data, dtype='<i2')
+        frame_count = len(samples) // channels
+        samples = samples[:frame_count * channels].reshape(frame_count, channels)
+        
+        sample_rate = self._sample_rate
+        up = down = 1
+        if resample_poly is not None and sample_rate > WHISPER_SAMPLE_RATE:
+            divisor = math.gcd(WHISPER_SAMPLE_RATE, sample_rate)
+            up, down = WHISPER_SAMPLE_RATE // divisor, sample_rate // divisor
+            sample_rate = WHISPER_SAMPLE_RATE
+        
+        # Blocks start on multiples of `down` so each maps to a whole number of output samples, and
+        # carry enough neighbouring input to cover resample_poly's filter, so the seams match a
+        # single pass over the whole recording
+        context = -(-10 // up) * down if down > 1 else 0
+        block = max(RESAMPLE_BLOCK_SECONDS * self._sample_rate // down, 1) * down
+        # Blocks are written straight into the returned buffer, so no final copy is made
+        output = bytearray(-(-frame_count * up // down) * self._sample_width)
+        pcm = np.frombuffer(output, dtype='<i2')
+        
+        for start in range(0, frame_count, block):
+            end = min(start + block, frame_count)
+            lead = min(context, start)
+            chunk = samples[start - lead:end + context].astype(np.float32)
+            mono = chunk.mean(axis=1) if channels > 1 else chunk[:, 0]
+            if down > 1:
+                mono = resample_poly(mono, up, down)
             
-        finally:
-            # Cleanup temp file
-            try:
-                os.unlink(temp_path)
-            except OSError:
-                pass
-    
-    def _create_wav_from_chunks(self, audio_chunks: List[bytes]) -> bytes:
-        """Create a WAV file from audio chunks"""
-        if not audio_chunks:
+            out_start = start * up // down
+            out_end = min(-(-end * up // down), len(pcm))
+            skip = lead * up // down
+            pcm[out_start:out_end] = np.clip(np.rint(mono[skip:skip + out_end - out_start]), -32768, 32767)
+        
+        return output, sample_rate, 1
+    
+    def _encode_audio(self, audio_data: bytes, sample_rate: int, channels: int) -> Tuple[bytes, str]:
+        """Encode PCM for upload as FLAC (lossless, about half the size) or WAV, returning data and suffix"""
+        if sf is None or np is None:
+            return self._create_wav(audio_data, sample_rate, channels), '.wav'
+        
+        buffer = io.BytesIO()
+        samples = np.frombuffer(audio_data, dtype='<i2').reshape(-1, channels)
+        sf.write(buffer, samples, sample_rate, format='FLAC', subtype='PCM_16')
+        return buffer.getvalue(), '.flac'
+    
+    def _create_wav(self, audio_data: bytes, sample_rate: int, channels: int) -> bytes:
+        """Create a WAV file from raw PCM audio"""
+        if not audio_data:
             return b""
         
-        # Calculate total data size
-        total_frames = len(audio_chunks) * (len(audio_chunks[0]) // (self._channels * self._sample_width))
-        
-        # Create WAV file in memory
-        with tempfile.NamedTemporaryFile() as temp_wav:
-            with wave.open(temp_wav.name, 'wb') as wav_file:
-                wav_file.setnchannels(self._channels)
-                wav_file.setsampwidth(self._sample_width)
-                wav_file.setframerate(self._sample_rate)
-                
-                # Write all audio data
-                for chunk in audio_chunks:
-                    wav_file.writeframes(chunk)
-            
-            # Read the WAV data
-            with open(temp_wav.name, 'rb') as f:
-                return f.read()
+        block_align = channels * self._sample_width
+        header = _WAV_HEADER.pack(
+            b'RIFF', 36 + len(audio_data), b'WAVE',
+            b'fmt ', 16, 1, channels, sample_rate, sample_rate * block_align, block_align, self._sample_width * 8,
+            b'data', len(audio_data)
+        )
+        return header + audio_data
     
-    def _transcribe_audio_file(self, audio_file_path: str) -> str:
-        """Transcribe audio file using OpenAI Whisper API"""
+    def _transcribe_audio(self, audio_data: bytes, suffix: str) -> str:
+        """Transcribe encoded audio bytes using OpenAI Whisper API"""
         try:
-            import openai
-            
-            client = openai.OpenAI(api_key=self.api_key)
+            transcript = self._get_client().audio.transcriptions.create(
+                model=self.model,
+                file=(f"audio{suffix}", audio_data, AUDIO_MIME_TYPES[suffix]),
+                response_format="text"
+            )
             
-            with open(audio_file_path, 'rb') as audio_file:
-                transcript = client.audio.transcriptions.create(
-                    model=self.model,
-                    file=audio_file
-                )
-            
-            return transcript.text.strip()
+            # "text" responses come back as a plain string, no JSON to decode
+            return transcript.strip()
             
         except Exception as e:
-            logger.error(f"OpenAI transcription API error: {e}")
+            logger.error("OpenAI transcription API error: %s", e)
             return ""
     
     
+    def _get_client(self):
+        """Return the shared OpenAI client, creating it on first use"""
+        if self._client is None:
+            if openai is None:
+                raise ImportError("OpenAI package is not installed. Please install with: pip install openai")
+            # Segment uploads call this from several threads at once
+            with _client_lock:
+                if self._client is None:
+                    self._client = openai.OpenAI(api_key=self.api_key, http_client=_get_http_client())
+        return self._client
+    
     def get_current_transcript(self) -> str:
         """Get current transcript (empty during recording, full after stop)"""
         return self.current_transcript
@@ -153,10 +336,20 @@ class SimpleTranscriber:
         return {
             'is_transcribing': self.is_transcribing,
             'current_length': len(self.current_transcript),
-            'buffer_chunks': len(self.audio_chunks),
+            'buffer_chunks': self._chunk_count,
+            'skipped_silence_seconds': self.skipped_silence_seconds,
             'model': self.model
         }
     
+    def get_cost_info(self) -> Dict[str, Any]:
+        """Estimate transcription cost; the buffer length is the only running count, so nothing is tallied per chunk"""
+        duration = len(self._audio_buffer) / (self._sample_rate * self._channels * self._sample_width)
+        billed_minutes = max(duration - self.skipped_silence_seconds, 0.0) / 60
+        return {
+            'total_duration_seconds': duration,
+            'total_cost': billed_minutes * self.cost_per_minute
+        }
+    
     def set_transcript_callback(self, callback: Optional[Callable] = None):
         """Set transcript callback (no-op in simple mode)"""
         pass
@@ -168,5 +361,18 @@ class SimpleTranscriber:
     def cleanup(self):
         """Cleanup resources"""
         self.is_transcribing = False
-        self.audio_chunks.clear()
+        self._audio_buffer.clear()
+        self._chunk_count = 0
         self.current_transcript = ""
+
+
+def _get_http_client():
+    """Return the process-wide httpx client (HTTP/2 when h2 is installed), or None for the SDK default"""
+    global _shared_http_client
+    if _shared_http_client is None and httpx is not None:
+        _shared_http_client = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+            follow_redirects=True
+        )
+    return _shared_http_client
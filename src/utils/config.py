@@ -1,13 +1,26 @@
 """Configuration management for Meeting Agent"""
 
 import os
+import copy
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+@lru_cache(maxsize=8)
+def _load_yaml(config_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML file; mtime and size are part of the cache key so edits are picked up"""
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
 def get_config_value(config: Dict[str, Any], key: str, default: Any = None) -> Any:
     keys = key.split('.')
     value = config
@@ -18,6 +31,30 @@ def get_config_value(config: Dict[str, Any], key: str, default: Any = None) -> A
             return default
     return value
 
+class Config:
+    """Read-only view of a configuration dict with dot-notation lookups"""
+    
+    def __init__(self, config_dict: Dict[str, Any]):
+        self._config = config_dict
+        # Every dotted path is precomputed, so get() is a single dict lookup
+        self._flat = dict(_flatten_config(config_dict))
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._flat.get(key, default)
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._config[key]
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._config
+
+def _flatten_config(config: Dict[str, Any], prefix: str = ''):
+    for key, value in config.items():
+        path = f"{prefix}{key}"
+        yield path, value
+        if isinstance(value, dict):
+            yield from _flatten_config(value, f"{path}.")
+
 def load_config(config_path: Optional[str] = None, validate_secrets: bool = True) -> Dict[str, Any]:
     """Load configuration from YAML file and environment variables"""
     if config_path is None:
@@ -25,8 +62,9 @@ def load_config(config_path: Optional[str] = None, validate_secrets: bool = True
     config = {}
     if os.path.exists(config_path):
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f) or {}
+            stat = os.stat(config_path)
+            # Callers overlay secrets onto the result, so never hand out the cached dict
+            config = copy.deepcopy(_load_yaml(str(config_path), stat.st_mtime_ns, stat.st_size))
         except Exception:
             pass  # Config file is optional
     if 'openai' not in config:
@@ -5,9 +5,32 @@ Helper utilities for Meeting Agent
 import re
 import os
 import json
-from datetime import datetime, timedelta
+import string
+from datetime import datetime, timedelta, timezone
 from typing import Union, Optional, Dict, Any, List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the stdlib error either way
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+_INVALID_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+_MULTIPLE_UNDERSCORES = re.compile(r'_+')
+
+_FILE_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + '._%+-')
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + '.-')
+_EMAIL_TLD_CHARS = frozenset(string.ascii_letters)
+
 
 def format_duration(seconds: Union[int, float]) -> str:
     """
@@ -22,19 +45,11 @@ def format_duration(seconds: Union[int, float]) -> str:
     if not isinstance(seconds, (int, float)) or seconds < 0:
         return "0s"
     
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
     
-    parts = []
-    if hours > 0:
-        parts.append(f"{hours}h")
-    if minutes > 0:
-        parts.append(f"{minutes}m")
-    if secs > 0 or not parts:  # Always show seconds if nothing else
-        parts.append(f"{secs}s")
-        
-    return " ".join(parts)
+    duration = (f"{hours}h " if hours else "") + (f"{minutes}m " if minutes else "") + (f"{secs}s" if secs else "")
+    return duration.rstrip() or "0s"  # Always show seconds if nothing else
 
 
 def safe_filename(filename: str, max_length: int = 255) -> str:
@@ -52,10 +67,10 @@ def safe_filename(filename: str, max_length: int = 255) -> str:
         return "unnamed"
     
     # Remove or replace invalid characters
-    safe = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    safe = filename.translate(_INVALID_FILENAME_CHARS)
     
     # Remove multiple underscores and trim
-    safe = re.sub(r'_+', '_', safe).strip('_')
+    safe = _MULTIPLE_UNDERSCORES.sub('_', safe).strip('_')
     
     # Ensure not empty
     if not safe:
@@ -68,34 +83,55 @@ def safe_filename(filename: str, max_length: int = 255) -> str:
     return safe
 
 
-def parse_time_string(time_str: str) -> Optional[datetime]:
+def parse_time_string(time_str: str, base: Optional[datetime] = None) -> Optional[datetime]:
     """
     Parse time string in HH:MM format to datetime object for today
     
     Args:
         time_str: Time string in HH:MM format (e.g., "22:00")
+        base: Datetime whose date is used instead of the current time
         
     Returns:
         datetime object for today at specified time, or None if invalid
     """
     try:
-        time_parts = time_str.split(':')
-        if len(time_parts) != 2:
-            return None
-            
-        hour = int(time_parts[0])
-        minute = int(time_parts[1])
+        if len(time_str) == 5 and time_str[2] == ':':
+            # Common fixed HH:MM layout, sliced directly without building a list
+            hour = int(time_str[:2])
+            minute = int(time_str[3:])
+        else:
+            time_parts = time_str.split(':')
+            if len(time_parts) != 2:
+                return None
+                
+            hour = int(time_parts[0])
+            minute = int(time_parts[1])
         
         if not (0 <= hour <= 23 and 0 <= minute <= 59):
             return None
             
-        now = datetime.now()
-        return now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if base is None:
+            base = datetime.now()
+        return base.replace(hour=hour, minute=minute, second=0, microsecond=0)
         
-    except (ValueError, AttributeError):
+    except (ValueError, AttributeError, TypeError):
         return None
 
 
+def parse_time_strings(time_strs: List[str]) -> List[Optional[datetime]]:
+    """
+    Parse several HH:MM time strings against a single reading of the clock
+    
+    Args:
+        time_strs: Time strings in HH:MM format
+        
+    Returns:
+        datetime objects for today (None for invalid entries)
+    """
+    now = datetime.now()
+    return [parse_time_string(time_str, now) for time_str in time_strs]
+
+
 def ensure_directory(path: Union[str, os.PathLike]) -> bool:
     """
     Ensure directory exists, create if it doesn't
@@ -106,9 +142,18 @@ def ensure_directory(path: Union[str, os.PathLike]) -> bool:
     Returns:
         True if directory exists or was created successfully
     """
+    # A single mkdir covers the common cases; makedirs is only needed for missing parents
     try:
-        os.makedirs(path, exist_ok=True)
+        os.mkdir(path)
         return True
+    except FileExistsError:
+        return os.path.isdir(path)
+    except FileNotFoundError:
+        try:
+            os.makedirs(path, exist_ok=True)
+            return True
+        except OSError:
+            return False
     except OSError:
         return False
 
@@ -144,8 +189,17 @@ def validate_email(email: str) -> bool:
     if not email or not isinstance(email, str):
         return False
     
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    # local@host.tld, checked with set lookups instead of a backtracking regex
+    local, _, domain = email.partition('@')
+    host, _, tld = domain.rpartition('.')
+    
+    return (
+        bool(local) and bool(host) and len(tld) >= 2
+        and '..' not in email
+        and _EMAIL_LOCAL_CHARS.issuperset(local)
+        and _EMAIL_DOMAIN_CHARS.issuperset(host)
+        and _EMAIL_TLD_CHARS.issuperset(tld)
+    )
 
 
 def get_file_size(file_path: Union[str, os.PathLike]) -> int:
@@ -158,8 +212,9 @@ def get_file_size(file_path: Union[str, os.PathLike]) -> int:
     Returns:
         File size in bytes, or 0 if file doesn't exist
     """
+    # Not cached: recordings grow and get deleted while callers watch them
     try:
-        return os.path.getsize(file_path)
+        return os.stat(file_path).st_size
     except OSError:
         return 0
 
@@ -174,22 +229,22 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted file size (e.g., "1.2 MB")
     """
-    if size_bytes == 0:
+    if size_bytes <= 0:
         return "0 B"
     
-    units = ['B', 'KB', 'MB', 'GB', 'TB']
-    i = 0
-    size = float(size_bytes)
-    
-    while size >= 1024 and i < len(units) - 1:
-        size /= 1024
-        i += 1
+    # Each unit is 2**10 times the previous one, so the bit length picks it directly
+    i = min((size_bytes.bit_length() - 1) // 10, len(_FILE_SIZE_UNITS) - 1)
+    size = size_bytes / (1 << (10 * i))
     
-    return f"{size:.1f} {units[i]}"
+    return f"{size:.1f} {_FILE_SIZE_UNITS[i]}"
 
 
 # Data processing utilities (merged from data_helpers.py)
 
+# Common JSON fields in meeting records
+MEETING_JSON_FIELDS = ('summary', 'action_items')
+
+
 def parse_meeting_json_fields(meeting_dict: Dict[str, Any]) -> Dict[str, Any]:
     """
     Parse JSON fields in meeting dictionary
@@ -206,18 +261,30 @@ def parse_meeting_json_fields(meeting_dict: Dict[str, Any]) -> Dict[str, Any]:
     if not meeting_dict:
         return meeting_dict
     
-    # Common JSON fields in meeting records
-    json_fields = ['summary', 'action_items']
+    return parse_meeting_json_fields_batch([meeting_dict])[0]
+
+
+def parse_meeting_json_fields_batch(meetings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Parse JSON fields for a list of meeting dictionaries in place
     
-    for field in json_fields:
-        if meeting_dict.get(field):
-            try:
-                meeting_dict[field] = json.loads(meeting_dict[field])
-            except (json.JSONDecodeError, TypeError):
-                # If parsing fails, keep original value
-                pass
+    Args:
+        meetings: Meeting dictionaries, e.g. rows loaded from the database
+        
+    Returns:
+        The same list, with JSON fields parsed
+    """
+    loads = _json_loads
+    for meeting_dict in meetings:
+        for field in MEETING_JSON_FIELDS:
+            if meeting_dict.get(field):
+                try:
+                    meeting_dict[field] = loads(meeting_dict[field])
+                except (json.JSONDecodeError, TypeError):
+                    # If parsing fails, keep original value
+                    pass
     
-    return meeting_dict
+    return meetings
 
 def calculate_meeting_duration(start_time, end_time) -> int:
     """
@@ -236,6 +303,32 @@ def calculate_meeting_duration(start_time, end_time) -> int:
     duration = end_time - start_time
     return int(duration.total_seconds() / 60)
 
+def calculate_meeting_durations(start_times: List[Any], end_times: List[Any]) -> List[int]:
+    """
+    Calculate durations in minutes for many meetings at once
+    
+    Args:
+        start_times: Meeting start datetimes
+        end_times: Meeting end datetimes, in the same order
+        
+    Returns:
+        Duration in minutes for each meeting (0 where a time is missing)
+    """
+    if np is None:
+        return [calculate_meeting_duration(start, end) for start, end in zip(start_times, end_times)]
+    
+    # One vectorized subtraction instead of a timedelta per meeting
+    durations = (np.array([_naive_utc(end) for end in end_times], dtype='datetime64[us]')
+                 - np.array([_naive_utc(start) for start in start_times], dtype='datetime64[us]'))
+    minutes = np.fix(durations / np.timedelta64(1, 'm'))
+    return np.where(np.isnat(durations), 0, minutes).astype(np.int64).tolist()
+
+def _naive_utc(value: Any) -> Any:
+    """Convert a timezone-aware datetime to naive UTC, which is what numpy's datetime64 expects"""
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
 def extract_action_items_count(summary: Optional[Dict[str, Any]]) -> int:
     """
     Extract action items count from meeting summary
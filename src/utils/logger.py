@@ -3,11 +3,18 @@ Logging utilities for Meeting Agent
 """
 
 import os
+import time
+import queue
+import atexit
 import logging
+import functools
 import sys
 from pathlib import Path
-from typing import Optional
-from logging.handlers import RotatingFileHandler
+from typing import Optional, Dict, Tuple
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+# Loggers already configured by setup_logger, keyed by its arguments
+_configured_loggers: Dict[Tuple[str, Optional[str], str], logging.Logger] = {}
 
 
 def setup_logger(name: str, log_file: Optional[str] = None, level: str = "INFO") -> logging.Logger:
@@ -22,10 +29,16 @@ def setup_logger(name: str, log_file: Optional[str] = None, level: str = "INFO")
     Returns:
         Configured logger instance
     """
+    key = (name, log_file, level)
+    cached = _configured_loggers.get(key)
+    if cached is not None:
+        return cached
+    
     logger = logging.getLogger(name)
     
     # Don't add handlers if they already exist
     if logger.handlers:
+        _configured_loggers[key] = logger
         return logger
     
     # Set level
@@ -56,8 +69,19 @@ def setup_logger(name: str, log_file: Optional[str] = None, level: str = "INFO")
         )
         file_handler.setFormatter(formatter)
         file_handler.setLevel(numeric_level)
-        logger.addHandler(file_handler)
+        
+        # Disk writes and rotation happen on a listener thread; logging calls only enqueue
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(numeric_level)
+        queue_handler.listener = listener
+        logger.addHandler(queue_handler)
     
+    _configured_loggers[key] = logger
     return logger
 
 
@@ -68,22 +92,21 @@ def get_logger(name: str) -> logging.Logger:
 
 def log_performance(func):
     """Decorator to log function execution time"""
-    import time
-    import functools
-    
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         logger = logging.getLogger(func.__module__)
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             result = func(*args, **kwargs)
-            execution_time = time.time() - start_time
-            logger.debug(f"{func.__name__} completed in {execution_time:.3f}s")
+            if logger.isEnabledFor(logging.DEBUG):
+                execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+                logger.debug("%s completed in %.3fs", func.__name__, execution_time)
             return result
         except Exception as e:
-            execution_time = time.time() - start_time
-            logger.debug(f"{func.__name__} failed after {execution_time:.3f}s: {e}")
+            if logger.isEnabledFor(logging.DEBUG):
+                execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+                logger.debug("%s failed after %.3fs: %s", func.__name__, execution_time, e)
             raise
             
     return wrapper
\ No newline at end of file
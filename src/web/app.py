@@ -1,60 +1,169 @@
 """Flask web application for Meeting Agent - Web interface for meetings"""
 
+import re
 import json
-from datetime import datetime, date
+from datetime import date
 from typing import Dict, Any, Optional
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, make_response, render_template, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
 
 from ..utils.logger import setup_logger
 from ..utils.config import get_config_value
 
 logger = setup_logger(__name__)
 
+_DATE_PATTERN = re.compile(r'([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})')
+
+
+def _parse_date(date_str: str) -> Optional[date]:
+    """Parse a YYYY-MM-DD string without strptime, returning None if it is not a valid date"""
+    match = _DATE_PATTERN.fullmatch(date_str)
+    if not match:
+        return None
+    try:
+        return date(int(match[1]), int(match[2]), int(match[3]))
+    except ValueError:  # e.g. 2024-02-30
+        return None
+
+
+
+def _conditional(response: Response) -> Response:
+    """Tag a GET response with an ETag and turn it into a 304 if the client already has it"""
+    # Weak, so flask-compress keeps the tag as-is on the compressed body and the 304 skips compression
+    response.add_etag(weak=True)
+    return response.make_conditional(request)
+
+
+def _cache_for(response: Response, cache_control: str) -> Response:
+    response.headers['Cache-Control'] = cache_control
+    return response
+
+
+# History pages change only when a meeting ends, so a few seconds of browser caching absorbs repeated reloads
+PAGE_CACHE_CONTROL = 'private, max-age=5, stale-while-revalidate=30'
+STATUS_CACHE_CONTROL = 'private, max-age=2, must-revalidate'
+
+# Columns the dashboard and history templates render; transcripts are only needed on the details page
+DASHBOARD_MEETING_FIELDS = ('id', 'name', 'date', 'start_time_minutes', 'duration_seconds',
+                            'duration_minutes', 'status')
+HISTORY_MEETING_FIELDS = DASHBOARD_MEETING_FIELDS + ('summary', 'action_items')
+
+# Endpoints that work without a meeting agent; None means no route matched, so the 404 handler runs
+AGENTLESS_ENDPOINTS = frozenset({None, 'static', 'healthz', 'readyz'})
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, keeping Flask's sorted keys and HTTP-date datetimes when encoding"""
+    
+    # Dates go through Flask's default() so they serialize exactly as with the stdlib provider
+    options = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson else 0
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:  # indent and friends are only supported by the stdlib encoder
+            return super().dumps(obj, **kwargs)
+        return self._encode(obj).decode()
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        # Used by request.get_json(); orjson's decode error is a ValueError, so Flask still answers 400
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        if self._app.debug:  # keep the indented output in debug mode
+            return super().response(*args, **kwargs)
+        
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._encode(obj) + b"\n", mimetype=self.mimetype)
+    
+    def _encode(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, default=self.default, option=self.options)
+        except TypeError:
+            # orjson rejects a few values the stdlib accepts, such as integers beyond 64 bits
+            return super().dumps(obj, separators=(",", ":")).encode()
+
+
 def create_app(config: Optional[Dict[str, Any]] = None, meeting_agent=None) -> Flask:
     app = Flask(__name__)
     app.config['SECRET_KEY'] = get_config_value(config, 'web.secret_key', 'meeting-agent-secret-key') if config else 'default-secret'
+    # Request bodies are small JSON commands; refuse anything bigger before it is parsed
+    app.config['MAX_CONTENT_LENGTH'] = 1024 * 1024
+    
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+    
+    # Meeting history and summaries are repetitive JSON/HTML that shrinks several-fold
+    if Compress is not None:
+        app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+        app.config['COMPRESS_MIN_SIZE'] = 500
+        Compress(app)
     
     app.meeting_agent = meeting_agent
     
+    @app.before_request
+    def require_agent():
+        """Answer 503 from every agent-backed route until the meeting agent exists"""
+        if app.meeting_agent is not None or request.endpoint in AGENTLESS_ENDPOINTS:
+            return None
+        if request.path.startswith('/api/'):
+            return jsonify({'error': 'Meeting Agent not initialized'}), 503
+        return render_template('error.html', error="Meeting Agent not initialized"), 503
+    
+    @app.route('/healthz')
+    def healthz():
+        """Liveness probe: answers without touching the meeting agent"""
+        return Response(b'OK\n', mimetype='text/plain')
+    
+    @app.route('/readyz')
+    def readyz():
+        """Readiness probe: the meeting agent is available"""
+        if app.meeting_agent is None:
+            return Response(b'Meeting Agent not initialized\n', status=503, mimetype='text/plain')
+        return Response(b'OK\n', mimetype='text/plain')
+    
     @app.route('/')
     def index():
         try:
-            if not app.meeting_agent:
-                return render_template('error.html', error="Meeting Agent not initialized")
             meeting_status = app.meeting_agent.get_meeting_status()
-            recent_meetings = app.meeting_agent.get_meeting_history(days_back=7)
+            recent_meetings = app.meeting_agent.get_meeting_history(days_back=7, limit=10,
+                                                                  fields=DASHBOARD_MEETING_FIELDS)
             
             return render_template('index.html', 
                                  meeting_status=meeting_status,
-                                 recent_meetings=recent_meetings[:10])
+                                 recent_meetings=recent_meetings)
         except Exception as e:
-            logger.error(f"Dashboard error: {e}")
+            logger.error("Dashboard error: %s", e)
             return render_template('error.html', error=str(e))
     
     @app.route('/api/status')
     def api_status():
         """Get meeting status"""
         try:
-            if not app.meeting_agent:
-                return jsonify({'error': 'Meeting Agent not initialized'}), 500
-            
             meeting_status = app.meeting_agent.get_meeting_status()
             
-            return jsonify({
+            return _conditional(_cache_for(jsonify({
                 'meeting': meeting_status
-            })
+            }), STATUS_CACHE_CONTROL))
             
         except Exception as e:
-            logger.error(f"Status API error: {e}")
+            logger.error("Status API error: %s", e)
             return jsonify({'error': str(e)}), 500
     
     @app.route('/api/start_meeting', methods=['POST'])
     def api_start_meeting():
         """Start a new meeting"""
         try:
-            if not app.meeting_agent:
-                return jsonify({'error': 'Meeting Agent not initialized'}), 500
-            
             data = request.get_json()
             if not data:
                 return jsonify({'error': 'No JSON data received'}), 400
@@ -80,9 +189,6 @@ def create_app(config: Optional[Dict[str, Any]] = None, meeting_agent=None) -> F
     def api_stop_meeting():
         """Stop the current meeting"""
         try:
-            if not app.meeting_agent:
-                return jsonify({'error': 'Meeting Agent not initialized'}), 500
-            
             # Stop the meeting
             completed_meeting = app.meeting_agent.stop_meeting()
             
@@ -92,47 +198,64 @@ def create_app(config: Optional[Dict[str, Any]] = None, meeting_agent=None) -> F
             })
             
         except ValueError as e:
-            logger.error(f"ValueError in stop_meeting: {e}")
+            logger.error("ValueError in stop_meeting: %s", e)
             return jsonify({'error': str(e)}), 400
         except Exception as e:
-            logger.error(f"Stop meeting API error: {e}")
+            logger.error("Stop meeting API error: %s", e)
             return jsonify({'error': str(e)}), 500
     
     @app.route('/api/meetings')
     def api_meetings():
         """Get meeting history"""
         try:
-            if not app.meeting_agent:
-                return jsonify({'error': 'Meeting Agent not initialized'}), 500
-            
             days_back = request.args.get('days', 30, type=int)
             meetings = app.meeting_agent.get_meeting_history(days_back)
             
-            return jsonify({
+            return _conditional(jsonify({
                 'meetings': meetings,
                 'total': len(meetings)
-            })
+            }))
             
         except Exception as e:
-            logger.error(f"Meetings API error: {e}")
+            logger.error("Meetings API error: %s", e)
             return jsonify({'error': str(e)}), 500
     
+    @app.route('/api/search')
+    def api_search():
+        """Search meeting names and transcripts"""
+        try:
+            query = request.args.get('q', '').strip()
+            if not query:
+                return jsonify({'success': False, 'error': 'Search query is required'}), 400
+            
+            # SQLite treats a negative LIMIT as no limit, so clamp both ends
+            limit = max(1, min(request.args.get('limit', 20, type=int), 100))
+            # Results render as history cards, so transcripts stay on the server
+            meetings = app.meeting_agent.search_meetings(query, limit, fields=HISTORY_MEETING_FIELDS)
+            
+            return _conditional(jsonify({
+                'success': True,
+                'meetings': meetings,
+                'total': len(meetings)
+            }))
+            
+        except Exception as e:
+            logger.error("Search API error: %s", e)
+            return jsonify({'success': False, 'error': str(e)}), 500
+    
     @app.route('/api/meetings/<int:meeting_id>')
     def api_meeting_details(meeting_id: int):
         """Get detailed meeting information"""
         try:
-            if not app.meeting_agent:
-                return jsonify({'error': 'Meeting Agent not initialized'}), 500
-            
             meeting = app.meeting_agent.get_meeting_details(meeting_id)
             
             if not meeting:
                 return jsonify({'error': 'Meeting not found'}), 404
             
-            return jsonify(meeting)
+            return _conditional(jsonify(meeting))
             
         except Exception as e:
-            logger.error(f"Meeting details API error: {e}")
+            logger.error("Meeting details API error: %s", e)
             return jsonify({'error': str(e)}), 500
     
     
@@ -140,16 +263,12 @@ def create_app(config: Optional[Dict[str, Any]] = None, meeting_agent=None) -> F
     def api_daily_summary():
         """Generate and get daily summary"""
         try:
-            if not app.meeting_agent:
-                return jsonify({'error': 'Meeting Agent not initialized'}), 500
-            
             date_str = request.args.get('date')
             target_date = None
             
             if date_str:
-                try:
-                    target_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-                except ValueError:
+                target_date = _parse_date(date_str)
+                if target_date is None:
                     return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
             
             summary = app.meeting_agent.generate_daily_summary(target_date)
@@ -157,24 +276,20 @@ def create_app(config: Optional[Dict[str, Any]] = None, meeting_agent=None) -> F
             return jsonify(summary)
             
         except Exception as e:
-            logger.error(f"Daily summary API error: {e}")
+            logger.error("Daily summary API error: %s", e)
             return jsonify({'error': str(e)}), 500
     
     @app.route('/api/send_daily_email', methods=['POST'])
     def api_send_daily_email():
         """Send daily summary email"""
         try:
-            if not app.meeting_agent:
-                return jsonify({'error': 'Meeting Agent not initialized'}), 500
-            
             data = request.get_json() or {}
             date_str = data.get('date')
             target_date = None
             
             if date_str:
-                try:
-                    target_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-                except ValueError:
+                target_date = _parse_date(date_str)
+                if target_date is None:
                     return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
             
             success = app.meeting_agent.send_daily_summary_email(target_date)
@@ -185,43 +300,44 @@ def create_app(config: Optional[Dict[str, Any]] = None, meeting_agent=None) -> F
             })
             
         except Exception as e:
-            logger.error(f"Send daily email API error: {e}")
+            logger.error("Send daily email API error: %s", e)
             return jsonify({'error': str(e)}), 500
     
     @app.route('/meetings')
     def meetings_page():
         """Meeting history page"""
         try:
-            if not app.meeting_agent:
-                    return render_template('error.html', error="Meeting Agent not initialized")
+            meetings = app.meeting_agent.get_meeting_history(days_back=30, fields=HISTORY_MEETING_FIELDS)
             
-            meetings = app.meeting_agent.get_meeting_history(days_back=30)
-            
-            return render_template('meetings.html', meetings=meetings)
+            return _cache_for(make_response(render_template('meetings.html', meetings=meetings)), PAGE_CACHE_CONTROL)
             
         except Exception as e:
-            logger.error(f"Meetings page error: {e}")
+            logger.error("Meetings page error: %s", e)
             return render_template('error.html', error=str(e))
     
     @app.route('/meetings/<int:meeting_id>')
     def meeting_details_page(meeting_id: int):
         """Meeting details page"""
         try:
-            if not app.meeting_agent:
-                return render_template('error.html', error="Meeting Agent not initialized")
-            
             meeting = app.meeting_agent.get_meeting_details(meeting_id)
             
             if not meeting:
                     return render_template('error.html', error="Meeting not found")
             
-            return render_template('meeting_details.html', meeting=meeting)
+            return _cache_for(make_response(render_template('meeting_details.html', meeting=meeting)), PAGE_CACHE_CONTROL)
             
         except Exception as e:
-            logger.error(f"Meeting details page error: {e}")
+            logger.error("Meeting details page error: %s", e)
             return render_template('error.html', error=str(e))
     
     
+    @app.after_request
+    def no_store_mutations(response: Response) -> Response:
+        # Start/stop/send results must never be replayed from a cache
+        if request.method == 'POST':
+            response.headers['Cache-Control'] = 'no-store'
+        return response
+    
     # Error handlers
     @app.errorhandler(404)
     def not_found(error):
@@ -0,0 +1,78 @@
+"""
+Unit tests for the shared SQLite connection
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+
+import pytest
+
+from src.database.database import Database
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database(str(tmp_path / "meetings.db"))
+    yield db
+    db.close()
+
+
+def pragma(db, name):
+    with db._connect() as conn:
+        return conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+
+class TestConnection:
+    """Test connection tuning and reuse"""
+    
+    def test_journal_mode_is_wal(self, db):
+        """Test the database is switched to write-ahead logging"""
+        assert pragma(db, 'journal_mode') == 'wal'
+        
+    def test_pragmas_applied(self, db):
+        """Test the per-connection tuning is in effect"""
+        assert pragma(db, 'synchronous') == 1  # NORMAL
+        assert pragma(db, 'cache_size') == -64000
+        assert pragma(db, 'mmap_size') == 268435456
+        
+    def test_threads_share_one_connection(self, db):
+        """Test request threads reuse the same connection instead of opening their own"""
+        connections = []
+        
+        def query():
+            db.get_meetings_by_date_range(7)
+            connections.append(db._conn)
+            
+        threads = [threading.Thread(target=query) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+            
+        assert len(connections) == 8
+        assert all(conn is connections[0] for conn in connections)
+        
+    def test_failed_write_rolls_back(self, db):
+        """Test an error inside an operation leaves no half-finished transaction"""
+        with pytest.raises(RuntimeError):
+            with db._connect() as conn:
+                conn.execute("INSERT INTO meetings (name, date) VALUES ('Partial', '2024-01-02')")
+                raise RuntimeError
+                
+        assert db.search_meetings("Partial") == []
+        
+    def test_close_releases_connection(self, db):
+        """Test close() closes the connection opened by another thread"""
+        thread = threading.Thread(target=db.save_meeting, args=("Standup",), kwargs={'start_time': datetime.now()})
+        thread.start()
+        thread.join()
+        conn = db._conn
+        
+        db.close()
+        
+        assert db._conn is None
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        # Later calls open a fresh connection
+        assert [m['name'] for m in db.search_meetings("standup")] == ["Standup"]
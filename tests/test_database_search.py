@@ -0,0 +1,53 @@
+"""
+Unit tests for meeting search
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.database.database import Database
+
+
+@pytest.fixture(params=[True, False], ids=['fts5', 'like'])
+def db(request, tmp_path):
+    db = Database(str(tmp_path / "meetings.db"))
+    budget = db.save_meeting("Budget review", start_time=datetime.now())
+    standup = db.save_meeting("Standup", start_time=datetime.now())
+    db.update_meeting_transcript(budget, "numbers for next quarter")
+    db.update_meeting_transcript(standup, "we discussed the budget and 50% cuts")
+    # Exercise the LIKE fallback against the same data
+    db.fts_enabled = db.fts_enabled and request.param
+    yield db
+    db.close()
+
+
+class TestSearchMeetings:
+    """Test search over meeting names and transcripts"""
+    
+    def test_matches_name_or_transcript(self, db):
+        """Test a word found in either column matches"""
+        names = {meeting['name'] for meeting in db.search_meetings("budget")}
+        assert names == {"Budget review", "Standup"}
+        
+    def test_every_word_must_match(self, db):
+        """Test words are ANDed, not searched as one phrase"""
+        assert [m['name'] for m in db.search_meetings("cuts budget")] == ["Standup"]
+        assert db.search_meetings("budget holiday") == []
+        
+    def test_special_characters_are_literal(self, db):
+        """Test search syntax and wildcards in user input are not interpreted"""
+        assert db.search_meetings('"cuts" OR NEAR(') == []
+        assert db.search_meetings("_") == []
+        
+    def test_projection_and_blank_query(self, db):
+        """Test field projection and that blank queries match nothing"""
+        assert db.search_meetings("standup", fields=('id', 'name')) == [{'id': 2, 'name': 'Standup'}]
+        assert db.search_meetings("   ") == []
+        
+    def test_index_follows_updates(self, db):
+        """Test transcripts saved after the meeting are searchable"""
+        meeting_id = db.save_meeting("Retro", start_time=datetime.now())
+        db.update_meeting_transcript(meeting_id, "velocity improved")
+        
+        assert [m['name'] for m in db.search_meetings("velocity")] == ["Retro"]
@@ -0,0 +1,249 @@
+"""
+Unit tests for EmailSender SMTP session handling
+"""
+
+import smtplib
+import threading
+import time
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from src.notifications.sender import EmailSender
+
+
+class FakeSMTP:
+    """Factory for mocked SMTP sessions that records every connection and send attempt"""
+    
+    def __init__(self, extensions=('starttls', 'auth'), refuse=(), disconnect_first=False, delay=0.0):
+        self.extensions = set(extensions)
+        self.refuse = set(refuse)
+        self.disconnect_first = disconnect_first
+        self.delay = delay
+        self.servers = []
+        self.attempts = []
+        self._lock = threading.Lock()
+        
+    def __call__(self, host, port):
+        server = MagicMock()
+        server.has_extn.side_effect = lambda name: name in self.extensions
+        server.noop.return_value = (250, b'OK')
+        server.rset.return_value = (250, b'OK')
+        server.send_message.side_effect = self._send
+        with self._lock:
+            self.servers.append(server)
+        return server
+        
+    def _send(self, msg):
+        with self._lock:
+            self.attempts.append(msg['To'])
+            first = len(self.attempts) == 1
+        time.sleep(self.delay)
+        if first and self.disconnect_first:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        if msg['To'] in self.refuse:
+            raise smtplib.SMTPRecipientsRefused({msg['To']: (550, b'No such user')})
+
+
+@pytest.fixture
+def sender():
+    sender = EmailSender(email_address="sender@example.com", email_password="password")
+    yield sender
+    sender.close()
+
+
+class TestSessionReuse:
+    """Test the shared SMTP session"""
+    
+    def test_batch_sending_reuses_connection(self):
+        """Test batch sending over a shared SMTP session with a message cap"""
+        sender = EmailSender(
+            email_address="sender@example.com",
+            email_password="password",
+            max_messages_per_connection=2
+        )
+        fake = FakeSMTP()
+        
+        with patch('smtplib.SMTP', side_effect=fake):
+            summaries = [{'meeting_name': f'Meeting {i}'} for i in range(5)]
+            results = sender.send_meeting_summaries(summaries)
+            
+        assert results == [True] * 5
+        assert len(fake.attempts) == 5
+        # Reconnects after every 2 messages
+        assert len(fake.servers) == 3
+        assert all(server.login.call_count == 1 for server in fake.servers)
+        
+    def test_refused_recipient_keeps_session(self, sender):
+        """Test a refused message is reported without reconnecting or resending"""
+        fake = FakeSMTP(refuse={'bad@example.com'})
+        
+        with patch('smtplib.SMTP', side_effect=fake):
+            results = sender.send_batch([
+                ('good@example.com', 'Subject', 'Body'),
+                ('bad@example.com', 'Subject', 'Body'),
+                ('other@example.com', 'Subject', 'Body'),
+                ('last@example.com', 'Subject', 'Body'),
+            ])
+            
+        assert results == [True, False, True, True]
+        assert fake.attempts.count('bad@example.com') == 1
+        assert len(fake.servers) == 1
+        fake.servers[0].rset.assert_called()
+        
+    def test_batch_aborts_on_refusals(self, sender):
+        """Test batch sending gives up once a third of the batch fails"""
+        fake = FakeSMTP(refuse={'bad@example.com'})
+        
+        with patch('smtplib.SMTP', side_effect=fake):
+            results = sender.send_batch([('bad@example.com', 'Subject', 'Body')] * 6)
+            
+        assert results == [False] * 6
+        # Aborted after 2 of 6 messages failed, each attempted once on one session
+        assert len(fake.attempts) == 2
+        assert len(fake.servers) == 1
+        
+    def test_disconnect_reconnects_and_retries(self, sender):
+        """Test a dropped session is reopened and the message resent once"""
+        fake = FakeSMTP(disconnect_first=True)
+        
+        with patch('smtplib.SMTP', side_effect=fake):
+            assert sender.send_meeting_summary({'meeting_name': 'Standup'}, 'team@example.com') is True
+            
+        assert fake.attempts == ['team@example.com', 'team@example.com']
+        assert len(fake.servers) == 2
+        
+    def test_concurrent_callers_serialized(self, sender):
+        """Test request threads never use the shared session at the same time"""
+        fake = FakeSMTP(delay=0.005)
+        in_flight = []
+        overlapped = []
+        
+        def send(msg):
+            in_flight.append(msg)
+            if len(in_flight) > 1:
+                overlapped.append(msg)
+            time.sleep(0.005)
+            in_flight.remove(msg)
+            
+        def factory(host, port):
+            server = fake(host, port)
+            server.send_message.side_effect = send
+            return server
+            
+        with patch('smtplib.SMTP', side_effect=factory):
+            threads = [
+                threading.Thread(target=sender.send_meeting_summary, args=({'meeting_name': str(i)},))
+                for i in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+                
+        assert not overlapped
+        assert len(fake.servers) == 1
+
+
+class TestConnectionNegotiation:
+    """Test STARTTLS and AUTH are negotiated from the server's EHLO"""
+    
+    def test_starttls_and_login(self, sender):
+        """Test a server advertising STARTTLS and AUTH gets both"""
+        fake = FakeSMTP(extensions=('starttls', 'auth'))
+        
+        with patch('smtplib.SMTP', side_effect=fake):
+            assert sender.send_batch([(None, 'Subject', 'Body')]) == [True]
+            
+        server = fake.servers[0]
+        server.starttls.assert_called_once()
+        server.login.assert_called_once_with("sender@example.com", "password")
+        
+    @pytest.mark.parametrize('options', [
+        {'smtp_server': 'localhost', 'smtp_port': 25},
+        {'smtp_server': '127.0.0.1', 'smtp_port': 25},
+        {'smtp_server': 'relay.internal', 'require_tls': False},
+    ])
+    def test_plain_relay_skips_tls_and_auth(self, options):
+        """Test a local or explicitly trusted relay without extensions is used as-is"""
+        sender = EmailSender(email_address="sender@example.com", email_password="password", **options)
+        fake = FakeSMTP(extensions=())
+        
+        with patch('smtplib.SMTP', side_effect=fake):
+            assert sender.send_batch([(None, 'Subject', 'Body')]) == [True]
+            
+        server = fake.servers[0]
+        server.starttls.assert_not_called()
+        server.login.assert_not_called()
+        
+    def test_stripped_starttls_refused(self, sender):
+        """Test a remote server whose EHLO lacks STARTTLS gets nothing in plain text"""
+        fake = FakeSMTP(extensions=())
+        
+        with patch('smtplib.SMTP', side_effect=fake):
+            assert sender.send_batch([(None, 'Subject', 'Body')]) == [False]
+            
+        for server in fake.servers:
+            server.login.assert_not_called()
+        assert not fake.attempts
+        
+    def test_auth_without_tls_refused(self, sender):
+        """Test credentials are never sent over an unencrypted session"""
+        fake = FakeSMTP(extensions=('auth',))
+        
+        with patch('smtplib.SMTP', side_effect=fake):
+            assert sender.send_batch([(None, 'Subject', 'Body')]) == [False]
+            
+        for server in fake.servers:
+            server.login.assert_not_called()
+        assert not fake.attempts
+
+
+class TestConcurrentBatches:
+    """Test batches sent over a pool of sessions"""
+    
+    def test_concurrent_batch_succeeds(self):
+        """Test every message is sent using at most `concurrency` sessions"""
+        sender = EmailSender(email_address="sender@example.com", email_password="password", concurrency=3)
+        fake = FakeSMTP(delay=0.001)
+        
+        with patch('smtplib.SMTP', side_effect=fake):
+            results = sender.send_batch([(f'user{i}@example.com', 'Subject', 'Body') for i in range(9)])
+            sender.close()
+            
+        assert results == [True] * 9
+        assert sorted(fake.attempts) == sorted(f'user{i}@example.com' for i in range(9))
+        assert len(fake.servers) <= 3
+        
+    def test_concurrent_refusals_keep_sessions_and_abort(self):
+        """Test refusals neither reconnect nor keep sending past the failure threshold"""
+        sender = EmailSender(email_address="sender@example.com", email_password="password", concurrency=2)
+        fake = FakeSMTP(refuse={'bad@example.com'}, delay=0.005)
+        
+        with patch('smtplib.SMTP', side_effect=fake):
+            results = sender.send_batch([('bad@example.com', 'Subject', 'Body')] * 12)
+            sender.close()
+            
+        assert results == [False] * 12
+        assert len(fake.servers) <= 2
+        # Abort after 4 failures; only messages already in flight may still go out
+        assert len(fake.attempts) < 12
+        
+    def test_session_cap_keeps_pool(self):
+        """Test recycling the shared session does not shut down the pool"""
+        sender = EmailSender(
+            email_address="sender@example.com",
+            email_password="password",
+            max_messages_per_connection=1,
+            concurrency=2
+        )
+        fake = FakeSMTP()
+        
+        with patch('smtplib.SMTP', side_effect=fake):
+            sender.send_batch([(None, 'Subject', 'Body')] * 2)
+            executor = sender._executor
+            
+            assert sender.send_meeting_summary({'meeting_name': 'Standup'}) is True
+            assert sender._executor is executor
+            sender.close()
+            
\ No newline at end of file
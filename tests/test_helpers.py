@@ -4,12 +4,15 @@ Unit tests for helper utilities
 
 import os
 import tempfile
+import warnings
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 from src.utils.helpers import (
-    format_duration, safe_filename, parse_time_string, ensure_directory,
-    truncate_text, validate_email, get_file_size, format_file_size
+    format_duration, safe_filename, parse_time_string, parse_time_strings, ensure_directory,
+    truncate_text, validate_email, get_file_size, format_file_size,
+    parse_meeting_json_fields, parse_meeting_json_fields_batch,
+    calculate_meeting_duration, calculate_meeting_durations
 )
 
 
@@ -117,6 +120,20 @@ class TestParseTimeString:
         assert parse_time_string("12:60") is None  # Invalid minute
         assert parse_time_string("-1:30") is None  # Negative hour
         assert parse_time_string("12:-5") is None  # Negative minute
+        
+    def test_parse_time_string_with_base(self):
+        """Test parsing against a supplied base datetime"""
+        base = datetime(2024, 3, 15, 8, 45, 12, 345)
+        assert parse_time_string("22:00", base) == datetime(2024, 3, 15, 22, 0)
+        
+    def test_parse_time_strings(self):
+        """Test parsing a batch of time strings"""
+        results = parse_time_strings(["09:30", "bad", "22:00"])
+        
+        assert results[1] is None
+        assert (results[0].hour, results[0].minute) == (9, 30)
+        assert (results[2].hour, results[2].minute) == (22, 0)
+        assert results[0].date() == results[2].date()
 
 
 class TestEnsureDirectory:
@@ -247,6 +264,17 @@ class TestGetFileSize:
         with tempfile.NamedTemporaryFile() as temp_file:
             size = get_file_size(temp_file.name)
             assert size == 0
+            
+    def test_get_file_size_not_stale(self):
+        """Test a growing and then deleted file is re-measured on every call"""
+        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+            assert get_file_size(temp_file.name) == 0
+            temp_file.write(b"audio")
+            temp_file.flush()
+            assert get_file_size(temp_file.name) == 5
+            
+        os.unlink(temp_file.name)
+        assert get_file_size(temp_file.name) == 0
 
 
 class TestFormatFileSize:
@@ -279,5 +307,72 @@ class TestFormatFileSize:
         assert format_file_size(1099511627776) == "1.0 TB"  # Exactly 1 TB
 
 
+
+class TestParseMeetingJsonFields:
+    """Test JSON field parsing for meeting records"""
+    
+    def test_parse_meeting_json_fields(self):
+        """Test parsing a single meeting record"""
+        meeting = {'id': 1, 'summary': '{"key_points": ["a"]}', 'action_items': '["x"]'}
+        parsed = parse_meeting_json_fields(meeting)
+        
+        assert parsed['summary'] == {'key_points': ['a']}
+        assert parsed['action_items'] == ['x']
+        assert parsed['id'] == 1
+        
+    def test_parse_meeting_json_fields_invalid_json(self):
+        """Test invalid JSON is left unchanged"""
+        meeting = {'summary': 'not json', 'action_items': None}
+        parsed = parse_meeting_json_fields(meeting)
+        
+        assert parsed['summary'] == 'not json'
+        assert parsed['action_items'] is None
+        
+    def test_parse_meeting_json_fields_batch(self):
+        """Test parsing a list of meeting records"""
+        meetings = [{'summary': '{"a": 1}'}, {'summary': '', 'action_items': '[]'}]
+        parsed = parse_meeting_json_fields_batch(meetings)
+        
+        assert parsed is meetings
+        assert parsed[0]['summary'] == {'a': 1}
+        assert parsed[1]['summary'] == ''
+        assert parsed[1]['action_items'] == []
+
+
+
+class TestCalculateMeetingDurations:
+    """Test batch meeting duration calculation"""
+    
+    def test_calculate_meeting_durations_matches_single(self):
+        """Test batch results match the single-meeting calculation"""
+        starts = [datetime(2024, 1, 1, 9, 0), datetime(2024, 1, 1, 10, 0, 30), datetime(2024, 1, 1, 12, 0)]
+        ends = [datetime(2024, 1, 1, 9, 45), datetime(2024, 1, 1, 11, 0), datetime(2024, 1, 1, 11, 30)]
+        
+        expected = [calculate_meeting_duration(start, end) for start, end in zip(starts, ends)]
+        assert calculate_meeting_durations(starts, ends) == expected == [45, 59, -30]
+        
+    def test_calculate_meeting_durations_missing_times(self):
+        """Test missing start or end times give zero"""
+        starts = [None, datetime(2024, 1, 1, 9, 0)]
+        ends = [datetime(2024, 1, 1, 9, 30), None]
+        
+        assert calculate_meeting_durations(starts, ends) == [0, 0]
+        
+    def test_calculate_meeting_durations_timezone_aware(self):
+        """Test aware datetimes are compared in UTC without numpy warnings"""
+        london = timezone(timedelta(hours=1))
+        starts = [datetime(2024, 6, 1, 9, 0, tzinfo=timezone.utc)]
+        ends = [datetime(2024, 6, 1, 10, 30, tzinfo=london)]
+        
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            assert calculate_meeting_durations(starts, ends) == [30]
+        assert calculate_meeting_duration(starts[0], ends[0]) == 30
+        
+    def test_calculate_meeting_durations_empty(self):
+        """Test empty input"""
+        assert calculate_meeting_durations([], []) == []
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
\ No newline at end of file
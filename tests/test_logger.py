@@ -3,6 +3,7 @@ Unit tests for logging utilities
 """
 
 import os
+import time
 import logging
 import tempfile
 import pytest
@@ -79,9 +80,13 @@ class TestSetupLogger:
             test_message = "Test log message"
             logger.info(test_message)
             
-            # Read the log file and check format
-            with open(log_file, 'r') as f:
-                log_content = f.read()
+            # Read the log file and check format; the write happens on the listener thread
+            deadline = time.time() + 5
+            log_content = ""
+            while test_message not in log_content and time.time() < deadline:
+                with open(log_file, 'r') as f:
+                    log_content = f.read()
+                time.sleep(0.01)
                 
             assert test_message in log_content
             assert "format_test_logger" in log_content
@@ -123,12 +128,13 @@ class TestLoggerIntegration:
             log_file = os.path.join(temp_dir, "rotation_test.log")
             logger = setup_logger("rotation_test_logger", log_file=log_file)
             
-            # Find the RotatingFileHandler
+            # Find the RotatingFileHandler behind the queue listener
             file_handler = None
             for handler in logger.handlers:
-                if hasattr(handler, 'maxBytes'):  # RotatingFileHandler
-                    file_handler = handler
-                    break
+                for listener_handler in getattr(getattr(handler, 'listener', None), 'handlers', ()):
+                    if hasattr(listener_handler, 'maxBytes'):  # RotatingFileHandler
+                        file_handler = listener_handler
+                        break
                     
             assert file_handler is not None
             assert file_handler.maxBytes == 10 * 1024 * 1024  # 10MB
@@ -0,0 +1,201 @@
+"""
+Unit tests for SimpleTranscriber's upload path: splitting, silence gate and encoding
+"""
+
+import struct
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.transcription import simple_transcriber
+from src.transcription.simple_transcriber import SimpleTranscriber, SEGMENT_SECONDS, SPLIT_SEARCH_SECONDS
+
+RATE = 16000
+
+
+def tone(seconds, amplitude, frequency=440.0):
+    """16-bit mono sine wave"""
+    t = np.arange(int(seconds * RATE)) / RATE
+    return (amplitude * np.sin(2 * np.pi * frequency * t)).astype('<i2')
+
+
+def record(transcriber, pcm, chunks=20):
+    """Feed PCM to a transcriber as if it came from the recorder"""
+    transcriber.start_transcription()
+    data = pcm.tobytes()
+    step = -(-len(data) // chunks) // 2 * 2
+    for offset in range(0, len(data), step):
+        transcriber.add_audio_chunk(data[offset:offset + step])
+
+
+@pytest.fixture
+def transcriber():
+    return SimpleTranscriber(api_key="test", sample_rate=RATE, channels=1)
+
+
+class TestSegmentSplitting:
+    """Test long recordings are split at quiet points"""
+    
+    def test_short_recording_single_segment(self, transcriber):
+        """Test audio under SEGMENT_SECONDS stays whole"""
+        pcm = tone(30, 1000).tobytes()
+        
+        segments = transcriber._split_segments(pcm, RATE, 1)
+        
+        assert len(segments) == 1
+        assert bytes(segments[0]) == pcm
+        
+    def test_long_recording_segments_in_order(self, transcriber):
+        """Test an 11 minute recording becomes three contiguous segments"""
+        pcm = tone(11 * 60, 1000).tobytes()
+        
+        segments = transcriber._split_segments(pcm, RATE, 1)
+        
+        assert len(segments) == 3
+        assert b"".join(bytes(segment) for segment in segments) == pcm
+        for segment in segments[:-1]:
+            seconds = len(segment) / (RATE * 2)
+            assert SEGMENT_SECONDS - SPLIT_SEARCH_SECONDS <= seconds <= SEGMENT_SECONDS
+            
+    def test_split_lands_in_quiet_window(self, transcriber):
+        """Test the cut moves back into a pause instead of falling mid-word"""
+        quiet_start = SEGMENT_SECONDS - 4
+        pcm = np.concatenate([
+            tone(quiet_start, 1000),
+            np.zeros(RATE // 2, dtype='<i2'),
+            tone(SEGMENT_SECONDS + 60 - quiet_start - 0.5, 1000),
+        ]).tobytes()
+        
+        segments = transcriber._split_segments(pcm, RATE, 1)
+        
+        cut_seconds = len(segments[0]) / (RATE * 2)
+        assert quiet_start <= cut_seconds <= quiet_start + 0.5
+
+
+class TestSilenceGate:
+    """Test the optional energy gate in front of the upload"""
+    
+    def test_silent_recording_skipped_at_zero_cost(self):
+        """Test a silent buffer is not uploaded or billed when the gate is on"""
+        transcriber = SimpleTranscriber(api_key="test", sample_rate=RATE, channels=1, silence_threshold=300)
+        record(transcriber, np.zeros(RATE * 20, dtype='<i2'))
+        
+        with patch.object(transcriber, '_transcribe_segment') as transcribe:
+            assert transcriber.stop_transcription() == ""
+            
+        transcribe.assert_not_called()
+        assert transcriber.skipped_silence_seconds == pytest.approx(20)
+        assert transcriber.get_cost_info()['total_cost'] == 0
+        
+    def test_quiet_speech_sent_by_default(self, transcriber):
+        """Test a low-gain microphone is still transcribed with the default settings"""
+        record(transcriber, tone(20, 150))  # RMS about 106, well under -40 dBFS
+        
+        with patch.object(transcriber, '_transcribe_segment', return_value="quiet words") as transcribe:
+            assert transcriber.stop_transcription() == "quiet words"
+            
+        transcribe.assert_called_once()
+        assert transcriber.skipped_silence_seconds == 0
+        
+    def test_quiet_speech_above_threshold_sent(self):
+        """Test a signal above a configured threshold passes the gate"""
+        transcriber = SimpleTranscriber(api_key="test", sample_rate=RATE, channels=1, silence_threshold=50)
+        record(transcriber, tone(20, 150))
+        
+        with patch.object(transcriber, '_transcribe_segment', return_value="quiet words"):
+            assert transcriber.stop_transcription() == "quiet words"
+            
+    def test_only_silent_segments_dropped(self):
+        """Test the gate skips a silent segment but keeps the rest in order"""
+        transcriber = SimpleTranscriber(api_key="test", sample_rate=RATE, channels=1, silence_threshold=300)
+        record(transcriber, np.concatenate([
+            tone(SEGMENT_SECONDS - SPLIT_SEARCH_SECONDS, 1000),
+            np.zeros(RATE * (SEGMENT_SECONDS + SPLIT_SEARCH_SECONDS), dtype='<i2'),
+            tone(60, 3000),
+        ]))
+        
+        def transcribe(segment, sample_rate, channels):
+            # Name each segment after the loudness of the tone it holds
+            return str(round(np.abs(np.frombuffer(segment, dtype='<i2')).max() / 1000))
+            
+        with patch.object(transcriber, '_transcribe_segment', side_effect=transcribe):
+            transcript = transcriber.stop_transcription()
+            
+        assert transcript == "1 3"
+        assert transcriber.skipped_silence_seconds > 0
+
+
+class TestParallelSegments:
+    """Test segments are transcribed concurrently but joined in recording order"""
+    
+    def test_transcripts_joined_in_order(self, transcriber):
+        """Test each segment's text ends up in recording order"""
+        record(transcriber, np.concatenate([
+            tone(SEGMENT_SECONDS, 1000),
+            tone(SEGMENT_SECONDS, 2000),
+            tone(60, 3000),
+        ]))
+        
+        def transcribe(segment, sample_rate, channels):
+            # Name each segment after the loudness of the tone it holds
+            return str(round(np.abs(np.frombuffer(segment, dtype='<i2')).max() / 1000))
+            
+        with patch.object(transcriber, '_transcribe_segment', side_effect=transcribe) as mocked:
+            transcript = transcriber.stop_transcription()
+            
+        assert mocked.call_count == 3
+        assert transcript == "1 2 3"
+
+
+class TestDownsampling:
+    """Test downmixing and resampling for Whisper"""
+    
+    @pytest.mark.parametrize('sample_rate,channels', [(44100, 2), (48000, 1), (16000, 2)])
+    def test_blocks_match_single_pass(self, sample_rate, channels):
+        """Test block-wise resampling matches resampling the whole recording at once"""
+        resample_poly = pytest.importorskip('scipy.signal').resample_poly
+        samples = np.random.default_rng(0).integers(-8000, 8000, (sample_rate * 3 + 123) * channels, dtype=np.int16)
+        transcriber = SimpleTranscriber(api_key="test", sample_rate=sample_rate, channels=channels)
+        
+        with patch.object(simple_transcriber, 'RESAMPLE_BLOCK_SECONDS', 1):
+            pcm, rate, mono = transcriber._downsample_for_whisper(samples.tobytes())
+            
+        expected = samples.reshape(-1, channels).mean(axis=1)
+        if sample_rate > RATE:
+            divisor = np.gcd(RATE, sample_rate)
+            expected = resample_poly(expected, RATE // divisor, sample_rate // divisor)
+        assert (rate, mono) == (RATE, 1)
+        actual = np.frombuffer(pcm, dtype='<i2')
+        assert len(actual) == len(expected)
+        # float32 blocks may round differently from the float64 reference by one step
+        assert np.abs(actual - np.rint(expected)).max() <= 1
+
+
+class TestEncoding:
+    """Test audio encoding for upload"""
+    
+    def test_wav_fallback(self, transcriber):
+        """Test a valid WAV is produced without soundfile"""
+        pcm = tone(1, 1000).tobytes()
+        
+        with patch.object(simple_transcriber, 'sf', None):
+            data, suffix = transcriber._encode_audio(pcm, RATE, 1)
+            
+        assert suffix == '.wav'
+        assert data[:4] == b'RIFF' and data[8:12] == b'WAVE'
+        assert struct.unpack('<I', data[24:28])[0] == RATE
+        assert data[44:] == pcm
+        
+    def test_flac_round_trip(self, transcriber):
+        """Test FLAC output decodes back to the same samples"""
+        sf = pytest.importorskip('soundfile')
+        import io
+        pcm = tone(1, 1000)
+        
+        data, suffix = transcriber._encode_audio(memoryview(pcm.tobytes()), RATE, 1)
+        
+        assert suffix == '.flac'
+        decoded, rate = sf.read(io.BytesIO(data), dtype='int16')
+        assert rate == RATE
+        assert np.array_equal(decoded, pcm)
@@ -0,0 +1,300 @@
+"""
+Unit tests for the Flask web application
+"""
+
+import json
+import pytest
+from datetime import datetime, date
+from unittest.mock import MagicMock
+
+from src.web.app import create_app
+
+
+@pytest.fixture
+def agent():
+    """Meeting agent stand-in with canned responses"""
+    agent = MagicMock()
+    agent.get_meeting_status.return_value = {'status': 'idle'}
+    agent.get_meeting_history.return_value = [{'id': 1, 'name': 'Standup', 'date': '2024-01-02'}]
+    agent.get_meeting_details.return_value = {'id': 1, 'name': 'Standup'}
+    agent.search_meetings.return_value = [{'id': 1, 'name': 'Standup', 'date': '2024-01-02'}]
+    return agent
+
+
+@pytest.fixture
+def client(agent):
+    app = create_app(meeting_agent=agent)
+    return app.test_client()
+
+
+class TestJsonResponses:
+    """Test JSON encoding of API responses"""
+    
+    def test_status_response(self, client):
+        """Test status payload round-trips as JSON"""
+        response = client.get('/api/status')
+        
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        assert response.get_json() == {'meeting': {'status': 'idle'}}
+        
+    def test_datetime_serialization(self, client, agent):
+        """Test datetimes keep Flask's HTTP-date format"""
+        agent.get_meeting_status.return_value = {'start_time': datetime(2024, 1, 2, 3, 4, 5)}
+        
+        response = client.get('/api/status')
+        
+        assert response.get_json()['meeting']['start_time'] == 'Tue, 02 Jan 2024 03:04:05 GMT'
+        
+    def test_keys_are_sorted(self, client, agent):
+        """Test keys are emitted in sorted order"""
+        agent.get_meeting_details.return_value = {'b': 1, 'a': 2}
+        
+        response = client.get('/api/meetings/1')
+        
+        assert response.data.decode().index('"a"') < response.data.decode().index('"b"')
+        
+    def test_large_integers(self, client, agent):
+        """Test values outside orjson's range still serialize"""
+        agent.get_meeting_details.return_value = {'value': 2 ** 70}
+        
+        response = client.get('/api/meetings/1')
+        
+        assert json.loads(response.data) == {'value': 2 ** 70}
+
+
+
+class TestJsonRequests:
+    """Test JSON request body handling"""
+    
+    def test_start_meeting_parses_body(self, client, agent):
+        """Test the meeting name is read from the JSON body"""
+        agent.start_meeting.return_value = {'id': 7, 'name': 'Planning'}
+        
+        response = client.post('/api/start_meeting', json={'name': ' Planning '})
+        
+        assert response.status_code == 200
+        agent.start_meeting.assert_called_once_with('Planning')
+        
+    def test_malformed_body_is_rejected(self, client, agent):
+        """Test invalid JSON never reaches the agent"""
+        response = client.post('/api/start_meeting', data='{"name": ', content_type='application/json')
+        
+        assert response.status_code >= 400
+        agent.start_meeting.assert_not_called()
+        
+    def test_oversized_body_is_rejected(self, client, agent):
+        """Test bodies over the size cap are not parsed"""
+        body = '{"name": "%s"}' % ('x' * (2 * 1024 * 1024))
+        
+        response = client.post('/api/start_meeting', data=body, content_type='application/json')
+        
+        assert response.status_code >= 400
+        agent.start_meeting.assert_not_called()
+
+
+class TestConditionalRequests:
+    """Test ETag handling on read endpoints"""
+    
+    @pytest.mark.parametrize('path', ['/api/status', '/api/meetings', '/api/meetings/1'])
+    def test_etag_not_modified(self, client, path):
+        """Test a matching If-None-Match returns 304 without a body"""
+        first = client.get(path)
+        assert first.status_code == 200
+        assert first.headers.get('ETag')
+        
+        second = client.get(path, headers={'If-None-Match': first.headers['ETag']})
+        assert second.status_code == 304
+        assert second.data == b''
+        
+    def test_etag_changes_with_content(self, client, agent):
+        """Test a changed payload is sent in full"""
+        first = client.get('/api/status')
+        agent.get_meeting_status.return_value = {'status': 'recording'}
+        
+        second = client.get('/api/status', headers={'If-None-Match': first.headers['ETag']})
+        assert second.status_code == 200
+        assert second.get_json() == {'meeting': {'status': 'recording'}}
+        
+    def test_etag_not_modified_when_compressed(self, client, agent):
+        """Test the ETag of a compressed response still revalidates to a 304"""
+        pytest.importorskip('flask_compress')
+        agent.get_meeting_history.return_value = [
+            {'id': i, 'name': f'Standup {i}', 'date': '2024-01-02'} for i in range(50)
+        ]
+        headers = {'Accept-Encoding': 'br, gzip'}
+        
+        first = client.get('/api/meetings', headers=headers)
+        assert first.headers.get('Content-Encoding') in ('br', 'gzip')
+        
+        second = client.get('/api/meetings', headers={**headers, 'If-None-Match': first.headers['ETag']})
+        assert second.status_code == 304
+        assert second.data == b''
+
+
+class TestCacheHeaders:
+    """Test Cache-Control headers"""
+    
+    def test_status_cache_control(self, client):
+        """Test status may be cached briefly but must be revalidated"""
+        response = client.get('/api/status')
+        assert response.headers['Cache-Control'] == 'private, max-age=2, must-revalidate'
+        
+    def test_meetings_page_cache_control(self, client):
+        """Test history pages are cacheable for a few seconds"""
+        response = client.get('/meetings')
+        assert 'max-age=5' in response.headers['Cache-Control']
+        
+    def test_mutations_not_stored(self, client, agent):
+        """Test POST responses are never cached"""
+        agent.stop_meeting.return_value = {'id': 1}
+        
+        response = client.post('/api/stop_meeting')
+        assert response.headers['Cache-Control'] == 'no-store'
+
+
+class TestMeetingHistoryQueries:
+    """Test pages only load the meeting columns they render"""
+    
+    def test_index_limits_and_projects_history(self, client, agent):
+        """Test the dashboard asks for ten meetings without transcripts"""
+        client.get('/')
+        
+        _, kwargs = agent.get_meeting_history.call_args
+        assert kwargs['limit'] == 10
+        assert 'transcript' not in kwargs['fields']
+        
+    def test_meetings_page_projects_history(self, client, agent):
+        """Test the history page skips transcripts but keeps summaries"""
+        client.get('/meetings')
+        
+        _, kwargs = agent.get_meeting_history.call_args
+        assert 'transcript' not in kwargs['fields']
+        assert 'summary' in kwargs['fields']
+
+
+class TestHealthChecks:
+    """Test liveness and readiness probes"""
+    
+    def test_healthz(self, client, agent):
+        """Test liveness does not call the agent"""
+        response = client.get('/healthz')
+        
+        assert response.status_code == 200
+        assert response.data == b'OK\n'
+        assert response.mimetype == 'text/plain'
+        assert not agent.method_calls
+        
+    def test_readyz(self, client):
+        """Test readiness with an agent"""
+        response = client.get('/readyz')
+        assert response.status_code == 200
+        
+    def test_readyz_without_agent(self):
+        """Test readiness fails before the agent exists"""
+        app = create_app(meeting_agent=None)
+        
+        response = app.test_client().get('/readyz')
+        assert response.status_code == 503
+
+
+class TestMissingAgent:
+    """Test routes before a meeting agent is attached"""
+    
+    @pytest.fixture
+    def bare_client(self):
+        return create_app(meeting_agent=None).test_client()
+    
+    def test_api_route_returns_503(self, bare_client):
+        """Test API routes answer with a JSON error"""
+        response = bare_client.get('/api/meetings')
+        
+        assert response.status_code == 503
+        assert response.get_json() == {'error': 'Meeting Agent not initialized'}
+        
+    def test_page_returns_503(self, bare_client):
+        """Test pages render the error template"""
+        response = bare_client.get('/meetings')
+        
+        assert response.status_code == 503
+        assert b'Meeting Agent not initialized' in response.data
+        
+    def test_unknown_route_still_404(self, bare_client):
+        """Test unmatched paths are not reported as a missing agent"""
+        assert bare_client.get('/nope').status_code == 404
+        
+    def test_healthz_without_agent(self, bare_client):
+        """Test liveness does not depend on the agent"""
+        assert bare_client.get('/healthz').status_code == 200
+
+
+class TestSearch:
+    """Test the meeting search API"""
+    
+    def test_search_results(self, client, agent):
+        """Test results come back in the shape the meetings page expects"""
+        response = client.get('/api/search?q=standup')
+        data = response.get_json()
+        
+        assert data['success'] is True
+        assert data['meetings'][0]['name'] == 'Standup'
+        args, kwargs = agent.search_meetings.call_args
+        assert args[0] == 'standup'
+        assert 'transcript' not in kwargs['fields']
+        
+    def test_search_requires_query(self, client, agent):
+        """Test a blank query is rejected without searching"""
+        response = client.get('/api/search?q=%20')
+        
+        assert response.status_code == 400
+        assert response.get_json()['success'] is False
+        agent.search_meetings.assert_not_called()
+        
+    @pytest.mark.parametrize('limit,expected', [('5000', 100), ('-1', 1), ('0', 1)])
+    def test_search_limit_capped(self, client, agent, limit, expected):
+        """Test callers cannot request unbounded result sets"""
+        client.get(f'/api/search?q=budget&limit={limit}')
+        
+        args, _ = agent.search_meetings.call_args
+        assert args[1] == expected
+
+
+class TestDailySummaryDates:
+    """Test date handling in daily summary endpoints"""
+    
+    def test_valid_date(self, client, agent):
+        """Test a valid date is passed to the agent"""
+        agent.generate_daily_summary.return_value = {'total_meetings': 0}
+        
+        response = client.get('/api/daily_summary?date=2024-02-29')
+        
+        assert response.status_code == 200
+        agent.generate_daily_summary.assert_called_once_with(date(2024, 2, 29))
+        
+    def test_single_digit_month_and_day(self, client, agent):
+        """Test unpadded dates are accepted as strptime accepted them"""
+        agent.generate_daily_summary.return_value = {'total_meetings': 0}
+        
+        response = client.get('/api/daily_summary?date=2024-1-5')
+        
+        assert response.status_code == 200
+        agent.generate_daily_summary.assert_called_once_with(date(2024, 1, 5))
+        
+    @pytest.mark.parametrize('date_str', ['2024-02-30', '2024/01/01', '24-01-01', '2024-01-01x'])
+    def test_invalid_dates(self, client, agent, date_str):
+        """Test malformed or impossible dates are rejected"""
+        response = client.get(f'/api/daily_summary?date={date_str}')
+        
+        assert response.status_code == 400
+        agent.generate_daily_summary.assert_not_called()
+        
+    def test_send_daily_email_invalid_date(self, client, agent):
+        """Test the email endpoint validates dates the same way"""
+        response = client.post('/api/send_daily_email', json={'date': '2023-13-01'})
+        
+        assert response.status_code == 400
+        agent.send_daily_summary_email.assert_not_called()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])